@@ -1,11 +1,17 @@
 """Emulation of Erstevak vacuum gauge over serial communication."""
 
 # pylint: disable=duplicate-code
-from typing import Optional
+from typing import Any, Awaitable, Optional
 import asyncio
 import time
 import logging
 
+try:
+    # Optional faster event loop, installed with the "uvloop" extra.
+    from uvloop import run as run_loop  # pylint: disable=import-error
+except ImportError:
+    from asyncio import run as run_loop
+
 from scietex.hal.serial import VirtualSerialPair
 from scietex.hal.serial.config import ModbusSerialConnectionConfig as Config
 
@@ -13,6 +19,15 @@ from scietex.hal.vacuum_gauge.erstevak.rs485.v1 import ErstevakVacuumGauge
 from scietex.hal.vacuum_gauge.erstevak.rs485.v1 import ErstevakEmulator
 
 
+async def timed(label: str, aw: Awaitable[Any], unit: str = "") -> Any:
+    """Await `aw`, print its result with the elapsed time and return the result."""
+    t1 = time.perf_counter_ns()
+    result = await aw
+    t2 = time.perf_counter_ns()
+    print(f"{label}: {result}{unit}, dt = {(t2 - t1) / 1e6} ms")
+    return result
+
+
 # pylint: disable=too-many-statements
 async def main(
     address: int,
@@ -33,127 +48,50 @@ async def main(
         backend="pymodbus",
     )
 
-    t1 = time.time()
-    model = await gauge.get_model()
-    t2 = time.time()
-    print(f"GAUGE MODEL: {model}, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.measure()
-    t2 = time.time()
-    print(f"PRESSURE: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.set_pressure(3.3e-3)
-    t2 = time.time()
-    print(f"PRESSURE SET: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.measure()
-    t2 = time.time()
-    print(f"PRESSURE: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(1)
-    t2 = time.time()
-    print(f"SP 1: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.set_setpoint(1, 5e-2)
-    t2 = time.time()
-    print(f"SP 1 SET: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(1)
-    t2 = time.time()
-    print(f"SP 1: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(2)
-    t2 = time.time()
-    print(f"SP 2: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.set_setpoint(2, 3e-5)
-    t2 = time.time()
-    print(f"SP 2 SET: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(2)
-    t2 = time.time()
-    print(f"SP 2: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    cal1 = await gauge.get_calibration(1)
-    t2 = time.time()
-    print(f"CAL 1: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal1 = await gauge.set_calibration(1, 2.3)
-    t2 = time.time()
-    print(f"CAL 1 SET: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal1 = await gauge.get_calibration(1)
-    t2 = time.time()
-    print(f"CAL 1: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.get_calibration(2)
-    t2 = time.time()
-    print(f"CAL 2: {cal2}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.set_calibration(2, 0.7)
-    t2 = time.time()
-    print(f"CAL 2 SET: {cal2}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.get_calibration(2)
-    t2 = time.time()
-    print(f"CAL 2: {cal2}, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_state(True)
-    t2 = time.time()
-    print(f"PENNING SET: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_state(False)
-    t2 = time.time()
-    print(f"PENNING SET: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_sync(False)
-    t2 = time.time()
-    print(f"PENNING SYNC SET: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_sync(True)
-    t2 = time.time()
-    print(f"PENNING SYNC SET: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.set_atmosphere()
-    t2 = time.time()
-    print(f"SET ATM: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.set_zero()
-    t2 = time.time()
-    print(f"SET ZERO: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
+    # Independent reads may be issued together, the client serializes them on the bus.
+    await timed(
+        "GAUGE MODEL, PRESSURE",
+        asyncio.gather(gauge.get_model(), gauge.measure()),
+    )
+
+    await timed("PRESSURE SET", gauge.set_pressure(3.3e-3), " mbar")
+
+    await timed("PRESSURE", gauge.measure(), " mbar")
+
+    await timed(
+        "BATCH READ",
+        gauge.read_many(["sp1", "sp2", "cal1", "cal2", "penning_state", "penning_sync"]),
+    )
+
+    await timed("SP 1", gauge.get_setpoint(1), " mbar")
+    await timed("SP 1 SET", gauge.set_setpoint(1, 5e-2), " mbar")
+    await timed("SP 1", gauge.get_setpoint(1), " mbar")
+
+    await timed("SP 2", gauge.get_setpoint(2), " mbar")
+    await timed("SP 2 SET", gauge.set_setpoint(2, 3e-5), " mbar")
+    await timed("SP 2", gauge.get_setpoint(2), " mbar")
+
+    await timed("CAL 1", gauge.get_calibration(1))
+    await timed("CAL 1 SET", gauge.set_calibration(1, 2.3))
+    await timed("CAL 1", gauge.get_calibration(1))
+    await timed("CAL 2", gauge.get_calibration(2))
+    await timed("CAL 2 SET", gauge.set_calibration(2, 0.7))
+    await timed("CAL 2", gauge.get_calibration(2))
+
+    await timed("PENNING ON", gauge.get_penning_state())
+    await timed("PENNING SET", gauge.set_penning_state(True))
+    await timed("PENNING ON", gauge.get_penning_state())
+    await timed("PENNING SET", gauge.set_penning_state(False))
+    await timed("PENNING ON", gauge.get_penning_state())
+
+    await timed("PENNING SYNC", gauge.get_penning_sync())
+    await timed("PENNING SYNC SET", gauge.set_penning_sync(False))
+    await timed("PENNING SYNC", gauge.get_penning_sync())
+    await timed("PENNING SYNC SET", gauge.set_penning_sync(True))
+    await timed("PENNING SYNC", gauge.get_penning_sync())
+
+    await timed("SET ATM", gauge.set_atmosphere(), " mbar")
+    await timed("SET ZERO", gauge.set_zero(), " mbar")
 
     await emulator.stop()
 
@@ -170,7 +108,7 @@ if __name__ == "__main__":
     GAUGE_ADDRESS = 1
     client_config = Config(vsp.serial_ports[0], baudrate=BAUDRATE, timeout=TIMEOUT)
     server_config = Config(vsp.serial_ports[1], baudrate=BAUDRATE, timeout=TIMEOUT)
-    asyncio.run(
+    run_loop(
         main(
             address=GAUGE_ADDRESS,
             client_con=client_config,
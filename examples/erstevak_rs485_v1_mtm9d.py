@@ -1,16 +1,31 @@
 """Example of Erstevak gauge usage over RS485 protocol."""
 
 # pylint: disable=duplicate-code
-from typing import Optional
+from typing import Any, Awaitable, Optional
 import asyncio
 import time
 import logging
 
+try:
+    # Optional faster event loop, installed with the "uvloop" extra.
+    from uvloop import run as run_loop  # pylint: disable=import-error
+except ImportError:
+    from asyncio import run as run_loop
+
 from scietex.hal.serial.config import ModbusSerialConnectionConfig as Config
 
 from scietex.hal.vacuum_gauge.erstevak.rs485.v1.client import ErstevakVacuumGauge
 
 
+async def timed(label: str, aw: Awaitable[Any], unit: str = "") -> Any:
+    """Await `aw`, print its result with the elapsed time and return the result."""
+    t1 = time.perf_counter_ns()
+    result = await aw
+    t2 = time.perf_counter_ns()
+    print(f"{label}: {result}{unit}, dt = {(t2 - t1) / 1e6} ms")
+    return result
+
+
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-statements
 async def main(address: int, client_con: Config, logger: Optional[logging.Logger] = None):
@@ -24,129 +39,54 @@ async def main(address: int, client_con: Config, logger: Optional[logging.Logger
         timeout=2.0,
         backend="pymodbus",
         # backend="pyserial"
+        # With the pyserial backend on Linux, passing rs485_mode (a serial.rs485.RS485Settings
+        # instance) switches the port to kernel RS485 mode instead of user-space RTS toggling.
+    )
+
+    # Independent reads may be issued together, the client serializes them on the bus.
+    await timed(
+        "GAUGE MODEL, PRESSURE",
+        asyncio.gather(gauge.get_model(), gauge.measure()),
+    )
+
+    await timed(
+        "BATCH READ",
+        gauge.read_many(["sp1", "sp2", "cal1", "cal2", "penning_state", "penning_sync"]),
     )
 
-    t1 = time.time()
-    model = await gauge.get_model()
-    t2 = time.time()
-    print(f"GAUGE MODEL: {model}, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.measure()
-    t2 = time.time()
-    print(f"PRESSURE: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(1)
-    t2 = time.time()
-    print(f"SP 1: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.set_setpoint(1, 5e-2)
-    t2 = time.time()
-    print(f"SP 1 SET: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(1)
-    t2 = time.time()
-    print(f"SP 1: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(2)
-    t2 = time.time()
-    print(f"SP 2: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.set_setpoint(2, 3.0)
-    t2 = time.time()
-    print(f"SP 2 SET: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    pressure = await gauge.get_setpoint(2)
-    t2 = time.time()
-    print(f"SP 2: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
+    await timed("SP 1", gauge.get_setpoint(1), " mbar")
+    await timed("SP 1 SET", gauge.set_setpoint(1, 5e-2), " mbar")
+    await timed("SP 1", gauge.get_setpoint(1), " mbar")
+
+    await timed("SP 2", gauge.get_setpoint(2), " mbar")
+    await timed("SP 2 SET", gauge.set_setpoint(2, 3.0), " mbar")
+    await timed("SP 2", gauge.get_setpoint(2), " mbar")
 
     # WARNING: Gauge calibration, be careful!
-    t1 = time.time()
-    cal1 = await gauge.get_calibration(1)
-    t2 = time.time()
-    print(f"CAL 1: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal1 = await gauge.set_calibration(1, 2.3)
-    t2 = time.time()
-    print(f"CAL 1 SET: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal1 = await gauge.get_calibration(1)
-    t2 = time.time()
-    print(f"CAL 1: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal1 = await gauge.set_calibration(1, 1.0)
-    t2 = time.time()
-    print(f"CAL 1 SET: {cal1}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.get_calibration(2)
-    t2 = time.time()
-    print(f"CAL 2: {cal2}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.set_calibration(2, 0.7)
-    t2 = time.time()
-    print(f"CAL 2 SET: {cal2}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.get_calibration(2)
-    t2 = time.time()
-    print(f"CAL 2: {cal2}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    cal2 = await gauge.set_calibration(2, 1.0)
-    t2 = time.time()
-    print(f"CAL 2 SET: {cal2}, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_state(True)
-    t2 = time.time()
-    print(f"PENNING SET: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_state(False)
-    t2 = time.time()
-    print(f"PENNING SET: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_state()
-    t2 = time.time()
-    print(f"PENNING ON: {status}, dt = {(t2 - t1) * 1000} ms")
-
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_sync(False)
-    t2 = time.time()
-    print(f"PENNING SYNC SET: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.set_penning_sync(True)
-    t2 = time.time()
-    print(f"PENNING SYNC SET: {status}, dt = {(t2 - t1) * 1000} ms")
-    t1 = time.time()
-    status = await gauge.get_penning_sync()
-    t2 = time.time()
-    print(f"PENNING SYNC: {status}, dt = {(t2 - t1) * 1000} ms")
+    await timed("CAL 1", gauge.get_calibration(1))
+    await timed("CAL 1 SET", gauge.set_calibration(1, 2.3))
+    await timed("CAL 1", gauge.get_calibration(1))
+    await timed("CAL 1 SET", gauge.set_calibration(1, 1.0))
+    await timed("CAL 2", gauge.get_calibration(2))
+    await timed("CAL 2 SET", gauge.set_calibration(2, 0.7))
+    await timed("CAL 2", gauge.get_calibration(2))
+    await timed("CAL 2 SET", gauge.set_calibration(2, 1.0))
+
+    await timed("PENNING ON", gauge.get_penning_state())
+    await timed("PENNING SET", gauge.set_penning_state(True))
+    await timed("PENNING ON", gauge.get_penning_state())
+    await timed("PENNING SET", gauge.set_penning_state(False))
+    await timed("PENNING ON", gauge.get_penning_state())
+
+    await timed("PENNING SYNC", gauge.get_penning_sync())
+    await timed("PENNING SYNC SET", gauge.set_penning_sync(False))
+    await timed("PENNING SYNC", gauge.get_penning_sync())
+    await timed("PENNING SYNC SET", gauge.set_penning_sync(True))
+    await timed("PENNING SYNC", gauge.get_penning_sync())
 
     # WARNING: Gauge calibration, be careful!
-    t1 = time.time()
-    pressure = await gauge.set_atmosphere()
-    t2 = time.time()
-    print(f"SET ATM: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
-    # t1 = time.time()
-    # pressure = await gauge.set_zero()
-    # t2 = time.time()
-    # print(f"SET ZERO: {pressure} mbar, dt = {(t2 - t1) * 1000} ms")
+    await timed("SET ATM", gauge.set_atmosphere(), " mbar")
+    # await timed("SET ZERO", gauge.set_zero(), " mbar")
 
 
 if __name__ == "__main__":
@@ -154,4 +94,4 @@ if __name__ == "__main__":
     logger_console = logging.getLogger()
 
     client_config = Config("/dev/cu.usbserial-141330", baudrate=19200, timeout=0.1)
-    asyncio.run(main(address=2, client_con=client_config, logger=logger_console))
+    run_loop(main(address=2, client_con=client_config, logger=logger_console))
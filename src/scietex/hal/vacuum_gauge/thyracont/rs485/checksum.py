@@ -2,21 +2,28 @@
 Checksum calculation functions.
 
 Functions:
-    _calc_checksum(msg: bytes) -> int: Calculates a custom checksum for a message.
-    _check_checksum(msg: bytes, cs: int) -> bool: Verifies the checksum of a message.
+    calc_checksum(msg: bytes) -> int: Calculates a custom checksum for a message.
+    check_checksum(msg: bytes, cs: int) -> bool: Verifies the checksum of a message.
 """
 
+from typing import Union
 
-def calc_checksum(msg: bytes) -> int:
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def calc_checksum(msg: BytesLike) -> int:
     """
     Calculate checksum for the message.
 
     Computes a custom checksum by summing the byte values of the message, taking the modulus 64,
-    and adding 64 to ensure the result falls within the ASCII printable range (64-127).
+    and adding 64 to ensure the result falls within the ASCII printable range (64-127). Both steps
+    are done with bit operations, as the low six bits never overlap the added 0x40.
+    The sum runs directly over the buffer, so no intermediate list of ints is created and
+    slices of a received frame may be passed as a memoryview without copying.
 
     Parameters
     ----------
-    msg : bytes
+    msg : bytes, bytearray or memoryview
         The message for which to calculate the checksum, excluding the checksum byte itself.
 
     Returns
@@ -24,18 +31,19 @@ def calc_checksum(msg: bytes) -> int:
     int
         The calculated checksum value, an integer between 64 and 127.
     """
-    return sum(list(msg)) % 64 + 64
+    return (sum(msg) & 0x3F) | 0x40
 
 
-def check_checksum(msg: bytes, cs: int) -> bool:
+def check_checksum(msg: BytesLike, cs: int) -> bool:
     """
     Check message checksum.
 
-    Verifies if the provided checksum matches the calculated checksum for the message.
+    Verifies if the provided checksum matches the calculated checksum for the message. The
+    checksum is computed inline, as in `calc_checksum`, to save a function call per frame.
 
     Parameters
     ----------
-    msg : bytes
+    msg : bytes, bytearray or memoryview
         The message to verify, excluding the checksum byte.
     cs : int
         The checksum value to compare against, typically the last byte of the received frame.
@@ -45,4 +53,4 @@ def check_checksum(msg: bytes, cs: int) -> bool:
     bool
         True if the calculated checksum matches `cs`, False otherwise.
     """
-    return calc_checksum(msg) == cs
+    return ((sum(msg) & 0x3F) | 0x40) == cs
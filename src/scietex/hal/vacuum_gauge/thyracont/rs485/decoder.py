@@ -36,11 +36,15 @@ class ThyracontRS485DecodePDU(DecodePDU):
         A nested dictionary for sub-function code lookups (unused in this implementation).
     is_server : bool
         Indicates whether the decoder is used in server mode (inherited from `DecodePDU`).
+    _pdu_class : Optional[type[ModbusPDU]]
+        The PDU class set by `register`, used by `decode` without a table lookup.
 
     Methods
     -------
     __init__(is_server: bool = False) -> None
         Initializes the decoder with an empty lookup table.
+    register(custom_class: type[ModbusPDU]) -> None
+        Registers the PDU class in the lookup table and caches it for decoding.
     lookupPduClass(data: bytes) -> Optional[type[ModbusPDU]]
         Retrieves the PDU class for decoding (always `ThyracontRequest` or None).
     decode(frame: bytes) -> Optional[ModbusPDU]
@@ -63,6 +67,22 @@ class ThyracontRS485DecodePDU(DecodePDU):
         super().__init__(is_server)
         self.pdu_table: dict[int, tuple[type[ModbusPDU], type[ModbusPDU]]] = {}
         self.pdu_sub_table: dict[int, dict[int, tuple[type[ModbusPDU], type[ModbusPDU]]]] = {}
+        self._pdu_class: Optional[type[ModbusPDU]] = None
+
+    def register(self, custom_class: type[ModbusPDU]) -> None:
+        """
+        Register the PDU class with the decoder.
+
+        Adds the class to `pdu_table` as the base class does and keeps a direct reference to it,
+        so that decoding a frame does not need a table lookup.
+
+        Parameters
+        ----------
+        custom_class : type[ModbusPDU]
+            The PDU class to register (e.g., `ThyracontRequest`).
+        """
+        super().register(custom_class)
+        self._pdu_class = custom_class
 
     def lookupPduClass(self, data: bytes) -> Optional[type[ModbusPDU]]:
         """
@@ -84,8 +104,8 @@ class ThyracontRS485DecodePDU(DecodePDU):
             The PDU class (`ThyracontRequest`) if registered in `lookup[0]`, otherwise None.
         """
         _ = data  # Unused parameter, kept for compatibility
-        function_code = 0
-        return self.pdu_table.get(function_code, (None, None))[self.pdu_inx]
+        # Registered class first; the table is only consulted if it was filled directly.
+        return self._pdu_class or self.pdu_table.get(0, (None, None))[self.pdu_inx]
 
     def decode(self, frame: bytes) -> Optional[ModbusPDU]:
         """
@@ -113,23 +133,18 @@ class ThyracontRS485DecodePDU(DecodePDU):
         ModbusException
             Caught internally if PDU instantiation or decoding fails (returns None).
         ValueError
-            Caught internally if decoding the command or data fails (returns None).
-        IndexError
-            Caught internally if the frame is too short (returns None).
+            Caught internally if the command or data is not ASCII (returns None).
         """
         if not frame:
             return None
         try:
-            function_code = 0
-            # pdu_type = self.lookupPduClass(frame)
-            # if pdu_type is None:
-            #     return None
-            if not (pdu_class := self.pdu_table.get(function_code, (None, None))[self.pdu_inx]):
+            pdu_class = self.lookupPduClass(frame)
+            if not pdu_class:
                 return None
-            command: str = frame[0:1].decode()
-            pdu = pdu_class(command=command, data=frame[1:])  # type: ignore[call-arg]
-            pdu.decode(frame[1:])
-            pdu.registers = list(frame)[1:7]
+            command: str = frame[:1].decode("ascii")
+            pdu = pdu_class(command=command)  # type: ignore[call-arg]
+            # The request keeps the 6-byte data field and its bytes as `registers`.
+            pdu.decode(frame[1:7])
             return pdu
-        except (ModbusException, ValueError, IndexError):
+        except (ModbusException, ValueError):
             return None
@@ -18,7 +18,17 @@ from pymodbus.exceptions import ModbusIOException
 from pymodbus.framer import FramerAscii
 from pymodbus.pdu import ModbusPDU
 
-from .checksum import calc_checksum, check_checksum
+from .checksum import calc_checksum
+
+# Device (slave) IDs as 3 ASCII digits, precomputed for the whole 0-255 address range.
+_DEVID_BYTES: tuple[bytes, ...] = tuple(b"%03d" % i for i in range(256))
+
+# Frame delimiters shared by all protocol versions, bound at module level for the decode hot path;
+# the class attributes below keep them available as part of the framer API.
+_START = b""
+_END = b"\r"
+_END_BYTE = _END[0]
+_EMPTY = b""
 
 
 class ThyracontRS485ASCIIFramer(FramerAscii):
@@ -46,13 +56,13 @@ class ThyracontRS485ASCIIFramer(FramerAscii):
         Decodes an incoming frame into device ID, transaction ID, and message data.
     encode(data: bytes, device_id: int, _tid: int) -> bytes
         Encodes a message into an Thyracont ASCII frame with device ID and checksum.
-    _processIncomingFrame(data: bytes) -> tuple[int, Optional[ModbusPDU]]
+    handleFrame(data: bytes, exp_devid: int, exp_tid: int) -> tuple[int, Optional[ModbusPDU]]
         Processes incoming data to extract and decode a complete frame.
     """
 
-    START = b""  # no starting byte.
-    END = b"\r"
-    EMPTY = b""
+    START = _START  # no starting byte.
+    END = _END
+    EMPTY = _EMPTY
     MIN_SIZE = 6  # Lower data min size to 4 bytes.
 
     def decode(self, data: bytes) -> tuple[int, int, int, bytes]:
@@ -62,8 +72,8 @@ class ThyracontRS485ASCIIFramer(FramerAscii):
         Decodes a Thyracont RS485 ASCII frame from raw bytes into its components: the number of
         bytes used, the device ID, a placeholder transaction ID (always 0), and the message data.
         The frame format is `<3-digit-device-id><message><1-byte-checksum>\\r`.
-        If the frame is incomplete or invalid (e.g., missing end byte or incorrect checksum),
-        it returns an empty message.
+        If the frame is incomplete or invalid (e.g., missing end byte, non-digit device ID or
+        incorrect checksum), it returns an empty message.
 
         Parameters
         ----------
@@ -80,22 +90,22 @@ class ThyracontRS485ASCIIFramer(FramerAscii):
             - frame_data (bytes): The decoded message data, excluding device ID and checksum, or
               `self.EMPTY` if decoding fails.
         """
-        len_used = 0
-        len_data = len(data)
-        while True:
-            if len_data - len_used < self.MIN_SIZE:
-                break
-            data_buffer = data[len_used:]
-            if (data_end := data_buffer.find(self.END)) == -1:
-                break
-            dev_id = int(data_buffer[0:3], 10)  # First 3 bytes for device (slave) id
-            checksum = data_buffer[data_end - 1]
-            msg = data_buffer[0 : data_end - 1]
-            len_used += data_end + 1
-            if not check_checksum(msg, checksum):
-                break
-            return len_used, dev_id, 0, msg[3:]
-        return len_used, 0, 0, self.EMPTY
+        # Single scan for the terminator; the buffer is never rescanned within a call.
+        # MIN_SIZE stays an attribute lookup: protocol versions override it.
+        if len(data) < self.MIN_SIZE or (data_end := data.find(_END_BYTE)) == -1:
+            return 0, 0, 0, _EMPTY
+        len_used = data_end + 1
+        # First 3 ASCII digits for device (slave) id
+        d0, d1, d2 = data[0], data[1], data[2]
+        if not (47 < d0 < 58 and 47 < d1 < 58 and 47 < d2 < 58):
+            return len_used, 0, 0, _EMPTY
+        msg = memoryview(data)[: data_end - 1]  # slice the view to avoid copying the buffer.
+        # Inlined check_checksum: valid checksum bytes are 0x40-0x7F and match the sum mod 64.
+        checksum = data[data_end - 1]
+        if checksum & 0xC0 != 0x40 or (sum(msg) - checksum) & 0x3F:
+            return len_used, 0, 0, _EMPTY
+        dev_id = (d0 - 48) * 100 + (d1 - 48) * 10 + (d2 - 48)
+        return len_used, dev_id, 0, bytes(msg[3:])
 
     def encode(self, payload: bytes, device_id: int, _tid: int) -> bytes:
         """
@@ -119,10 +129,11 @@ class ThyracontRS485ASCIIFramer(FramerAscii):
         bytes
             The fully encoded frame, e.g., `b"001<message><checksum>\\r"`.
         """
-        dev_id = f"{device_id:03d}".encode()  # encode device id into first 3 bytes.
-        checksum = calc_checksum(dev_id + payload)
-        frame = self.START + dev_id + payload + bytes([checksum]) + self.END
-        return frame
+        # encode device id into first 3 bytes.
+        msg = bytearray(_DEVID_BYTES[device_id] if 0 <= device_id < 256 else b"%03d" % device_id)
+        msg += payload
+        msg.append(calc_checksum(msg))
+        return b"".join((self.START, msg, self.END))
 
     def handleFrame(
         self, data: bytes, exp_devid: int, exp_tid: int
@@ -13,12 +13,13 @@ Classes:
         to read and write gauge data.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 import sys
 import asyncio
 from logging import Logger
 
 import serial
+from serial.rs485 import RS485Settings
 from pymodbus.pdu import ModbusPDU
 
 from scietex.hal.serial.config import (
@@ -39,6 +40,26 @@ from .decoder import ThyracontDecodePDU
 from .request import ThyracontRequest
 
 
+def _state_decode(data: str) -> bool:
+    """Decode an on/off state response data."""
+    return bool(int(data))
+
+
+# Read-only values available for batched reading: field name -> (command, data, decoder).
+READ_MANY_COMMANDS: dict[
+    str, tuple[str, Optional[bytes], Callable[[str], Optional[str | float | bool]]]
+] = {
+    "model": ("T", None, str),
+    "pressure": ("M", None, _pressure_decode),
+    "sp1": ("S", b"1", _pressure_decode),
+    "sp2": ("S", b"2", _pressure_decode),
+    "cal1": ("C", b"1", _calibration_decode),
+    "cal2": ("C", b"2", _calibration_decode),
+    "penning_state": ("I", None, _state_decode),
+    "penning_sync": ("W", None, _state_decode),
+}
+
+
 # Determine the correct TimeoutError based on Python version
 if sys.version_info >= (3, 11):
     TimeoutErrorAlias = asyncio.TimeoutError
@@ -74,11 +95,15 @@ class ThyracontVacuumGauge(RS485Client):
         A label for the gauge (default "Thyracont Gauge"), inherited from `RS485Client`.
     logger : Optional[Logger]
         A logger instance for debugging, inherited from `RS485Client`.
+    rs485_mode : Optional[RS485Settings]
+        RS485 RTS control settings for the "pyserial" backend.
+    _bus_lock : asyncio.Lock
+        Lock serializing request-response exchanges on the bus.
 
     Methods
     -------
-    __init__(connection_config, address=1, label=None, logger=None, timeout=None, backend=None)
-        -> None
+    __init__(connection_config, address=1, label=None, logger=None, timeout=None, backend=None,
+             rs485_mode=None) -> None
         Initializes the client with connection parameters and optional settings.
     request_gauge(command: str, data: Optional[bytes] = None) -> Optional[str]
         Sends a command to the gauge and returns the response data.
@@ -110,6 +135,8 @@ class ThyracontVacuumGauge(RS485Client):
         Retrieves the Penning synchronization state.
     set_penning_sync(state: bool) -> Optional[bool]
         Sets the Penning synchronization state.
+    read_many(fields: list[str]) -> dict
+        Reads several gauge values in one batch.
     read_data() -> dict
         Reads and returns a dictionary of gauge data (currently only pressure).
     """
@@ -123,6 +150,7 @@ class ThyracontVacuumGauge(RS485Client):
         logger: Optional[Logger] = None,
         timeout: Optional[float] = None,
         backend: Optional[str] = None,
+        rs485_mode: Optional[RS485Settings] = None,
     ) -> None:
         """
         Initialize a ThyracontVacuumGauge client instance.
@@ -145,6 +173,10 @@ class ThyracontVacuumGauge(RS485Client):
             The communication timeout in seconds. Defaults to 1.0 if None.
         backend : Optional[str], optional
             The communication backend ("pymodbus" or "pyserial"). Defaults to "pymodbus" if None.
+        rs485_mode : Optional[RS485Settings], optional
+            RS485 RTS control settings applied to the port opened by the "pyserial" backend.
+            On Linux these are passed to the kernel RS485 driver (`TIOCSRS485`), which switches
+            the transceiver without the user-space RTS toggling delay. Defaults to None.
         """
         _label = "Thyracont Gauge"
         if label is not None:  # Corrected logic to use provided label
@@ -164,6 +196,10 @@ class ThyracontVacuumGauge(RS485Client):
         self.backend = "pymodbus"
         if backend == "pyserial":
             self.backend = "pyserial"
+        self.rs485_mode: Optional[RS485Settings] = rs485_mode
+        # Serializes bus access so that concurrent requests (e.g. via asyncio.gather)
+        # never interleave their frames on the RS485 line.
+        self._bus_lock = asyncio.Lock()
 
     # pylint: disable=duplicate-code
     async def request_gauge(self, command: str, data: Optional[bytes] = None) -> Optional[str]:
@@ -191,43 +227,97 @@ class ThyracontVacuumGauge(RS485Client):
         request = ThyracontRequest(
             command=command, data=data, dev_id=self.address, transaction_id=0
         )
-        if self.backend == "pymodbus":
-            try:
-                response: Optional[ModbusPDU] = await asyncio.wait_for(
-                    self.execute(request, no_response_expected=False),
-                    timeout=self.timeout,
-                )
-                if response and hasattr(response, "data"):
-                    self.logger.debug("Response: %s", response.data)
-                    result = response.data
-            except TimeoutErrorAlias:
-                result = None
-        elif self.backend == "pyserial":
-            custom_framer = ThyracontASCIIFramer(ThyracontDecodePDU(is_server=False))
-            encoded_frame = custom_framer.buildFrame(request)  # Corrected method name
-            self.logger.debug("Encoded Frame: %s", encoded_frame)
-            inter_byte_timeout = 0.01
-            if hasattr(self.con_params, "inter_byte_timeout") and isinstance(
-                self.con_params.inter_byte_timeout, float
-            ):
-                inter_byte_timeout = self.con_params.inter_byte_timeout
-            con = serial.Serial(
-                port=self.con_params.port,
-                baudrate=self.con_params.baudrate,
-                bytesize=self.con_params.bytesize,
-                stopbits=self.con_params.stopbits,
-                parity=self.con_params.parity,
-                timeout=self.con_params.timeout,
-                inter_byte_timeout=inter_byte_timeout,
-            )
-            con.write(encoded_frame)
-            serial_response = con.readline()
-            self.logger.debug("SERIAL READ: %s", serial_response)
-            parsed = self._parse_response(serial_response)
-            result = parsed["data"]
-            con.close()
+        async with self._bus_lock:
+            if self.backend == "pymodbus":
+                try:
+                    response: Optional[ModbusPDU] = await asyncio.wait_for(
+                        self.execute(request, no_response_expected=False),
+                        timeout=self.timeout,
+                    )
+                    if response and hasattr(response, "data"):
+                        self.logger.debug("Response: %s", response.data)
+                        result = response.data
+                except TimeoutErrorAlias:
+                    result = None
+            elif self.backend == "pyserial":
+                result = (await asyncio.to_thread(self._serial_requests, [request]))[0]
         return result
 
+    def _serial_connection(self) -> serial.Serial:
+        """
+        Open a pyserial connection to the gauge.
+
+        Returns
+        -------
+        serial.Serial
+            An open serial port configured from `con_params` and `rs485_mode`.
+        """
+        inter_byte_timeout = 0.01
+        if hasattr(self.con_params, "inter_byte_timeout") and isinstance(
+            self.con_params.inter_byte_timeout, float
+        ):
+            inter_byte_timeout = self.con_params.inter_byte_timeout
+        con = serial.Serial(
+            port=self.con_params.port,
+            baudrate=self.con_params.baudrate,
+            bytesize=self.con_params.bytesize,
+            stopbits=self.con_params.stopbits,
+            parity=self.con_params.parity,
+            timeout=self.con_params.timeout,
+            inter_byte_timeout=inter_byte_timeout,
+        )
+        if self.rs485_mode is not None:
+            con.rs485_mode = self.rs485_mode
+        return con
+
+    def _serial_requests(self, requests: list[ThyracontRequest]) -> list[Optional[str]]:
+        """
+        Send requests over one pyserial connection and return their response data.
+
+        This call blocks, the async methods run it in a worker thread to keep the event
+        loop free.
+
+        Parameters
+        ----------
+        requests : list[ThyracontRequest]
+            The requests to send, in order.
+
+        Returns
+        -------
+        list[Optional[str]]
+            The response data for each request, None for an invalid response.
+        """
+        con = self._serial_connection()
+        try:
+            return [self._serial_exchange(con, request) for request in requests]
+        finally:
+            con.close()
+
+    def _serial_exchange(self, con: serial.Serial, request: ThyracontRequest) -> Optional[str]:
+        """
+        Write a request frame to an open serial port and read back the response data.
+
+        Parameters
+        ----------
+        con : serial.Serial
+            An open serial port.
+        request : ThyracontRequest
+            The request to send.
+
+        Returns
+        -------
+        Optional[str]
+            The response data as a string, or None if the response is invalid.
+        """
+        custom_framer = ThyracontASCIIFramer(ThyracontDecodePDU(is_server=False))
+        encoded_frame = custom_framer.buildFrame(request)
+        self.logger.debug("Encoded Frame: %s", encoded_frame)
+        con.write(encoded_frame)
+        # Frames end with CR, read up to it instead of waiting for a newline or timeout.
+        serial_response = con.read_until(custom_framer.END)
+        self.logger.debug("SERIAL READ: %s", serial_response)
+        return self._parse_response(serial_response)["data"]
+
     def _parse_response(self, response: bytes) -> dict:
         """
         Parse a raw serial response into a dictionary of components.
@@ -537,6 +627,59 @@ class ThyracontVacuumGauge(RS485Client):
             return bool(int(data_str))
         return None
 
+    async def read_many(self, fields: list[str]) -> dict:
+        """
+        Read several gauge values in one batch.
+
+        The Thyracont ASCII protocol carries a single command per frame, so the values can not
+        be packed into one request. With the "pyserial" backend the serial port is opened once
+        for the whole batch rather than once per value. With the "pymodbus" backend this is
+        a convenience wrapper issuing one `request_gauge` call per value.
+
+        Parameters
+        ----------
+        fields : list[str]
+            Names of values to read, any of "model", "pressure", "sp1", "sp2", "cal1", "cal2",
+            "penning_state", "penning_sync".
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each requested field to its decoded value (or None if
+            the request fails).
+
+        Raises
+        ------
+        ValueError
+            If an unknown field name is requested.
+        """
+        for field in fields:
+            if field not in READ_MANY_COMMANDS:
+                raise ValueError(
+                    f"Unknown field {field}. Supported fields: {', '.join(READ_MANY_COMMANDS)}"
+                )
+        raw: list[Optional[str]] = []
+        if self.backend == "pyserial":
+            requests = [
+                ThyracontRequest(
+                    command=READ_MANY_COMMANDS[field][0],
+                    data=READ_MANY_COMMANDS[field][1],
+                    dev_id=self.address,
+                    transaction_id=0,
+                )
+                for field in fields
+            ]
+            async with self._bus_lock:
+                raw = await asyncio.to_thread(self._serial_requests, requests)
+        else:
+            for field in fields:
+                command, data, _ = READ_MANY_COMMANDS[field]
+                raw.append(await self.request_gauge(command, data))
+        return {
+            field: READ_MANY_COMMANDS[field][2](value) if value else None
+            for field, value in zip(fields, raw)
+        }
+
     async def read_data(self) -> dict:
         """
         Read and return a dictionary of gauge data.
@@ -4,35 +4,51 @@ Thyracont RS485 Version 1 Data Module.
 This module provides utility functions for encoding and decoding pressure and calibration data
 for Thyracont's RS485 protocol, used in vacuum gauge communication (e.g., VSP model). Pressure
 values (in millibars) are encoded into a 6-digit string format combining a 4-digit mantissa and a
-2-digit exponent, while calibration values are encoded as scaled integers. The module uses the
-`Decimal` class for precise floating-point manipulation.
+2-digit exponent, while calibration values are encoded as scaled integers. Exponents are found with
+`math.log10` against a table of precomputed powers of ten, and mantissas are returned as `Decimal`.
 
 Functions:
     f_exp(number: float) -> int
         Calculates the exponent of a number based on its decimal representation.
     f_man(number: float) -> Decimal
         Extracts the mantissa of a number as a normalized Decimal.
+    _pressure_digits(pressure: float) -> tuple[int, int]
+        Splits a pressure value into its 4-digit mantissa and 2-digit exponent code as integers.
     _pressure_encode(pressure: float) -> str
         Encodes a pressure value into a 6-digit string (4-digit mantissa, 2-digit exponent).
-    _pressure_decode(data: str) -> Optional[float]
+    _pressure_decode(data: str | bytes) -> Optional[float]
         Decodes a pressure value from a 6-digit string.
     _calibration_encode(cal: float) -> str
         Encodes a calibration value into a string as a scaled integer.
-    _calibration_decode(data: str) -> Optional[float]
+    _calibration_decode(data: str | bytes) -> Optional[float]
         Decodes a calibration value from a string.
 """
 
-from typing import Optional
-from decimal import Decimal
+from typing import Optional, TypeGuard
+from decimal import Decimal, ROUND_HALF_UP
+import math
+
+# Powers of ten for exponents -30..79, covering the 2-digit protocol exponent range.
+_POW10_OFFSET = 30
+_POW10: tuple[float, ...] = tuple(10.0**i for i in range(-_POW10_OFFSET, 80))
+
+
+def _pow10(exp: int) -> float:
+    """Return 10**exp as float, from the precomputed table when it is in range."""
+    if 0 <= exp + _POW10_OFFSET < len(_POW10):
+        return _POW10[exp + _POW10_OFFSET]
+    return 10.0**exp
 
 
 def f_exp(number: float) -> int:
     """
     Get exponent of a number.
 
-    Calculates the exponent of a number by analyzing its `Decimal` representation. The exponent is
-    determined as the length of the digits plus the Decimal’s exponent minus 1, effectively giving
-    the power of 10 needed to express the number in scientific notation.
+    Calculates the exponent of a number as the floor of its decimal logarithm, giving the power of
+    10 needed to express the number in scientific notation. The logarithm may round across a power
+    of ten, so the result is checked against the tabulated powers and corrected by one if needed.
+    Outside the table (where `10.0**exponent` over- or underflows) the exponent is read from the
+    shortest `repr` of the number instead, which gives the same result.
 
     Parameters
     ----------
@@ -44,19 +60,30 @@ def f_exp(number: float) -> int:
     int
         The exponent of the number in scientific notation (e.g., 2 for 123.45, -3 for 0.00123).
     """
-    (_, digits, exponent) = Decimal(number).as_tuple()
-    if isinstance(exponent, int):
-        return len(digits) + exponent - 1
-    raise ValueError(f"Invalid argument {number} in f_exp function.")
+    if not math.isfinite(number):
+        raise ValueError(f"Invalid argument {number} in f_exp function.")
+    if number == 0:
+        return 0
+    number = abs(number)
+    exponent = math.floor(math.log10(number))
+    index = exponent + _POW10_OFFSET
+    if not 0 <= index < len(_POW10) - 1:
+        return Decimal(repr(number)).adjusted()
+    if number < _POW10[index]:
+        return exponent - 1
+    if number >= _POW10[index + 1]:
+        return exponent + 1
+    return exponent
 
 
 def f_man(number: float) -> Decimal:
     """
     Get mantissa of a number.
 
-    Extracts the mantissa of a number by scaling it to a value between 1 and 10 (or 0 if the number
-    is zero) using its exponent, then normalizing it to remove trailing zeros. The result is a
-    `Decimal` object representing the significand in scientific notation.
+    Scales the shortest decimal representation of the number (its `repr`) by its exponent to
+    a value in [1, 10), or 0 if the number is zero, then normalizes it to remove trailing zeros.
+    The result is a `Decimal` object representing the significand in scientific notation
+    (e.g. exactly 1 for 1e-6).
 
     Parameters
     ----------
@@ -68,7 +95,38 @@ def f_man(number: float) -> Decimal:
     Decimal
         The mantissa of the number (e.g., 1.2345 for 123.45, 1.23 for 0.00123).
     """
-    return Decimal(number).scaleb(-f_exp(number)).normalize()
+    return Decimal(repr(number)).scaleb(-f_exp(number)).normalize()
+
+
+def _is_digits(data: Optional[str | bytes]) -> TypeGuard[str | bytes]:
+    """Check `data` is a non-empty str or bytes of ASCII digits only, without a regex or int()."""
+    return isinstance(data, (str, bytes)) and data.isascii() and data.isdigit()
+
+
+def _pressure_digits(pressure: float) -> tuple[int, int]:
+    """
+    Split pressure (in mbar) into the integer fields of the 6-digit data string.
+
+    Parameters
+    ----------
+    pressure : float
+        The pressure value in millibars (mbar) to encode (e.g., 1.23e-3).
+
+    Returns
+    -------
+    tuple[int, int]
+        The mantissa (1000 to 9999, or 0 for zero pressure) and the exponent offset by +20.
+
+    Raises
+    ------
+    ValueError
+        If `pressure` is infinite or NaN (raised by `f_exp`).
+    """
+    exp = f_exp(pressure)
+    base = int(round(pressure * _pow10(3 - exp)))
+    if base == 10000:  # e.g. 9.9996 rounds up to the next decade.
+        base, exp = 1000, exp + 1
+    return base, exp + 20
 
 
 def _pressure_encode(pressure: float) -> str:
@@ -90,18 +148,23 @@ def _pressure_encode(pressure: float) -> str:
         A 6-digit string encoding the pressure (e.g., "123403" for 1.23e-3 mbar, where 1234 is the
         mantissa and 03 is the exponent -20 + 20).
 
+    Raises
+    ------
+    ValueError
+        If `pressure` is infinite or NaN (raised by `f_exp`).
+
     Notes
     -----
-    - Mantissa is calculated as `int(f_man(pressure) * 1000)`, giving 3 digits of precision.
+    - Mantissa is calculated in integers as `round(pressure * 10**(3 - f_exp(pressure)))`, giving
+      3 digits of precision; a mantissa rounded up to 10000 is carried into the exponent.
     - Exponent is shifted by +20 (i.e., `f_exp(pressure) + 20`) to ensure non-negative values within
       typical vacuum ranges.
     """
-    base = int(round(f_man(pressure) * 1000))
-    exp = int(round(f_exp(pressure) + 20))
+    base, exp = _pressure_digits(pressure)
     return f"{base:04d}{exp:02d}"
 
 
-def _pressure_decode(data: str) -> Optional[float]:
+def _pressure_decode(data: Optional[str | bytes]) -> Optional[float]:
     """
     Parse pressure (in mbar) from response data.
 
@@ -111,29 +174,19 @@ def _pressure_decode(data: str) -> Optional[float]:
 
     Parameters
     ----------
-    data : str
-        A 6-digit string encoding the pressure (e.g., "123403" for 1.23e-3 mbar).
+    data : str or bytes
+        A 6-digit string encoding the pressure (e.g., "123403" for 1.23e-3 mbar). Raw response bytes
+        are accepted as well and validated without decoding them first.
 
     Returns
     -------
     Optional[float]
-        The decoded pressure value in millibars (mbar), or None if parsing fails.
-
-    Raises
-    ------
-    TypeError
-        Caught internally if `data` is not a string or convertible to integers.
-    ValueError
-        Caught internally if `data` cannot be parsed into integers (e.g., non-numeric).
+        The decoded pressure value in millibars (mbar), or None if `data` is not a string of six
+        ASCII digits.
     """
-    try:
-        if len(data) != 6:
-            return None
-        base: int = int(data[:4])
-        exp: int = int(data[4:]) - 23
-        return float(base * 10**exp)
-    except (TypeError, ValueError):
+    if not _is_digits(data) or len(data) != 6:
         return None
+    return int(data[:4]) * _pow10(int(data[4:]) - 23)
 
 
 def _calibration_encode(cal: float) -> str:
@@ -141,7 +194,9 @@ def _calibration_encode(cal: float) -> str:
     Encode a calibration value into a string.
 
     Converts a calibration factor (a float) into a string by scaling it by 100 and rounding to the
-    nearest integer. This format is used for calibration registers in the Thyracont protocol.
+    nearest integer, with halves rounded away from zero. The scaling is done on the shortest
+    decimal representation of the float, so no binary rounding error creeps in. This format is
+    used for calibration registers in the Thyracont protocol.
 
     Parameters
     ----------
@@ -153,35 +208,31 @@ def _calibration_encode(cal: float) -> str:
     str
         The encoded calibration value as a string (e.g., "123" for 1.23).
     """
-    return f"{int(round(cal * 100))}"
+    return str(int(Decimal(repr(cal)).scaleb(2).quantize(Decimal(1), ROUND_HALF_UP)))
 
 
-def _calibration_decode(data: str) -> Optional[float]:
+def _calibration_decode(data: Optional[str | bytes]) -> Optional[float]:
     """
     Decode a calibration value from a string.
 
     Parses a string into a calibration factor by converting it to an integer and scaling it down
-    by 100. Returns None if decoding fails.
+    by 100. A leading minus sign is accepted, as `_calibration_encode` emits one for negative
+    values. Returns None if decoding fails.
 
     Parameters
     ----------
-    data : str
-        The string encoding the calibration value (e.g., "123" for 1.23).
+    data : str or bytes
+        The string encoding the calibration value (e.g., "123" for 1.23), or its raw bytes.
 
     Returns
     -------
     Optional[float]
-        The decoded calibration value, or None if parsing fails.
-
-    Raises
-    ------
-    TypeError
-        Caught internally if `data` is not a string or convertible to an integer.
-    ValueError
-        Caught internally if `data` cannot be parsed into an integer (e.g., non-numeric).
+        The decoded calibration value, or None if `data` is not a non-empty string of ASCII digits
+        with an optional leading minus sign.
     """
-    try:
-        cal: float = int(data) / 100
-        return cal
-    except (TypeError, ValueError):
+    sign = 1
+    if isinstance(data, (str, bytes)) and data[:1] in ("-", b"-"):
+        data, sign = data[1:], -1
+    if not _is_digits(data):
         return None
+    return sign * int(data) / 100
@@ -5,7 +5,7 @@ This module provides utility functions for emulating a Thyracont vacuum gauge's
 protocol, specifically interacting with a Modbus slave context. It supports reading and writing
 32-bit values across pairs of 16-bit holding registers, converting pressure values to and from an
 encoded format, and parsing custom ASCII commands for the Thyracont MTM9D gauge. The module relies
-on external utilities for numeric splitting/combining and pressure encoding/decoding.
+on the v1 data utilities for pressure encoding/decoding.
 
 Constants:
     REG_P (int): Register address for pressure value (32-bit, spans REG_P and REG_P+1).
@@ -19,6 +19,7 @@ Constants:
     REG_CAL_SEL (int): Register address for calibration selection flag (16-bit).
     REG_ATM_SEL (int): Register address for atmosphere adjustment flag (16-bit).
     REG_ZERO_SEL (int): Register address for zero adjustment flag (16-bit).
+    GAUGE_TYPE (bytes): Gauge type reported in response to the "T" command.
 
 Functions:
     read_two_regs(context: ModbusSlaveContext, start_reg: int) -> int
@@ -33,10 +34,9 @@ Functions:
         Parses and executes Thyracont-specific ASCII commands, returning a response.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from pymodbus.datastore import ModbusDeviceContext
-from scietex.hal.serial.utilities.numeric import split_32bit, combine_32bit
-from .data import _pressure_encode, _pressure_decode
+from .data import _pressure_digits, _pow10
 
 
 REG_P = 0
@@ -51,13 +51,32 @@ REG_CAL_SEL = 11
 REG_ATM_SEL = 12
 REG_ZERO_SEL = 13
 
+GAUGE_TYPE = b"MTM09D"
+
+
+def _read_pair(values: list[int], start_reg: int) -> int:
+    """Combine the 32-bit value stored at `start_reg` of the holding register list.
+
+    Same little-endian word order as `combine_32bit`: the low word is at `start_reg`.
+    """
+    return ((values[start_reg + 1] & 0xFFFF) << 16) | (values[start_reg] & 0xFFFF)
+
+
+def _write_pair(values: list[int], value: int, start_reg: int) -> None:
+    """Split a 32-bit value into the holding register list at `start_reg`.
+
+    Same little-endian word order as `split_32bit`: the low word goes to `start_reg`.
+    """
+    values[start_reg] = value & 0xFFFF
+    values[start_reg + 1] = (value & 0xFFFFFFFF) >> 16
+
 
 def read_two_regs(context: ModbusDeviceContext, start_reg: int) -> int:
     """
     Reads a 32-bit value from two consecutive 16-bit holding registers.
 
     Combines two 16-bit values from the Modbus slave context's holding registers into a single
-    32-bit integer using the `combine_32bit` utility.
+    32-bit integer, in the little-endian word order of the `combine_32bit` utility.
 
     Parameters
     ----------
@@ -71,17 +90,15 @@ def read_two_regs(context: ModbusDeviceContext, start_reg: int) -> int:
     int
         The 32-bit value combined from the two registers (`start_reg` and `start_reg + 1`).
     """
-    a = context.store["h"].values[start_reg]
-    b = context.store["h"].values[start_reg + 1]
-    return combine_32bit(a, b)
+    return _read_pair(context.store["h"].values, start_reg)
 
 
 def write_two_regs(context: ModbusDeviceContext, value: int, start_reg: int) -> None:
     """
     Writes a 32-bit value to two consecutive 16-bit holding registers.
 
-    Splits a 32-bit integer into two 16-bit values using the `split_32bit` utility and writes them
-    to the Modbus slave context's holding registers.
+    Splits a 32-bit integer into two 16-bit values, in the little-endian word order of the
+    `split_32bit` utility, and writes them to the Modbus slave context's holding registers.
 
     Parameters
     ----------
@@ -92,17 +109,16 @@ def write_two_regs(context: ModbusDeviceContext, value: int, start_reg: int) ->
     start_reg : int
         The starting register address (e.g., 0 for REG_P).
     """
-    a, b = split_32bit(value)
-    context.store["h"].values[start_reg] = a
-    context.store["h"].values[start_reg + 1] = b
+    _write_pair(context.store["h"].values, value, start_reg)
 
 
 def pressure_from_reg(context: ModbusDeviceContext, start_reg: int) -> Optional[float]:
     """
     Reads and decodes a pressure value from two registers.
 
-    Retrieves a 32-bit encoded pressure value from two consecutive registers, formats it as a
-    6-digit string, and decodes it into a float using the `_pressure_decode` utility.
+    Retrieves a 32-bit encoded pressure value from two consecutive registers and decodes it in
+    integers: the last two decimal digits hold the exponent offset by +23 relative to the 4-digit
+    mantissa, exactly as in the `_pressure_decode` utility, but without a string round trip.
 
     Parameters
     ----------
@@ -113,20 +129,24 @@ def pressure_from_reg(context: ModbusDeviceContext, start_reg: int) -> Optional[
 
     Returns
     -------
-    float
-        The decoded pressure value in millibars (mbar).
+    float or None
+        The decoded pressure value in millibars (mbar), or None if the registers hold more than
+        6 decimal digits.
     """
     p_encoded = read_two_regs(context, start_reg)
-    return _pressure_decode(f"{p_encoded:06d}")
+    if p_encoded > 999999:
+        return None
+    mantissa, exp = divmod(p_encoded, 100)
+    return mantissa * _pow10(exp - 23)
 
 
 def pressure_to_reg(context: ModbusDeviceContext, p: float, start_reg: int) -> None:
     """
     Encodes and writes a pressure value to two registers.
 
-    Encodes a pressure value (in millibars) into a 6-digit string using the `_pressure_encode`
-    utility, converts it to an integer, and writes it as a 32-bit value across two consecutive
-    registers.
+    Encodes a pressure value (in millibars) into the 6-digit integer `mantissa * 100 + exponent`
+    using the `_pressure_digits` utility, without building the data string, and writes it as a
+    32-bit value across two consecutive registers.
 
     Parameters
     ----------
@@ -136,12 +156,139 @@ def pressure_to_reg(context: ModbusDeviceContext, p: float, start_reg: int) -> N
         The pressure value in millibars (mbar) to encode and write.
     start_reg : int
         The starting register address (e.g., 0 for REG_P).
+
+    Raises
+    ------
+    ValueError
+        If `p` is infinite or NaN, or its exponent does not fit in two digits.
     """
-    p_encoded = int(_pressure_encode(p))
-    write_two_regs(context, p_encoded, start_reg)
+    base, exp = _pressure_digits(p)
+    if not 0 <= exp <= 99:
+        raise ValueError(f"Pressure {p} can not be encoded in 6 digits.")
+    write_two_regs(context, base * 100 + exp, start_reg)
+
+
+# Command handlers: each gets the holding register list and the request data and returns
+# the response data, which is the request data echoed back for writes.
+CommandHandler = Callable[[list[int], str], bytes]
+
+_SELECT_SP = {"1": REG_SP1, "2": REG_SP2}
+_SELECT_CAL = {"1": REG_CAL1, "2": REG_CAL2}
+
+
+def _select_or_write(values: list[int], data: str, sel_reg: int, registers: dict[str, int]) -> None:
+    """Select a target register with "1"/"2" or write `data` to the selected one."""
+    if data in registers:
+        values[sel_reg] = int(data)
+    elif (selected := registers.get(str(values[sel_reg]))) is not None:
+        _write_pair(values, int(data), selected)
+        values[sel_reg] = 0
+
+
+def _cmd_gauge_type(_values: list[int], _data: str) -> bytes:
+    """Handle "T": return the gauge type."""
+    return GAUGE_TYPE
+
+
+def _cmd_read_pressure(values: list[int], _data: str) -> bytes:
+    """Handle "M": read the current pressure."""
+    return b"%06d" % _read_pair(values, REG_P)
+
+
+def _cmd_write_pressure(values: list[int], data: str) -> bytes:
+    """Handle "m": write a new pressure, ignoring non-numeric data."""
+    try:
+        _write_pair(values, int(data), REG_P)
+    except ValueError:
+        pass
+    return data.encode()
+
+
+def _cmd_read_setpoint(values: list[int], data: str) -> bytes:
+    """Handle "S": read setpoint 1 or 2."""
+    if (reg := _SELECT_SP.get(data)) is None:
+        return data.encode()
+    return b"%06d" % _read_pair(values, reg)
+
+
+def _cmd_write_setpoint(values: list[int], data: str) -> bytes:
+    """Handle "s": select a setpoint or write the selected one."""
+    _select_or_write(values, data, REG_SP_SEL, _SELECT_SP)
+    return data.encode()
+
+
+def _cmd_read_calibration(values: list[int], data: str) -> bytes:
+    """Handle "C": read calibration 1 or 2."""
+    if (reg := _SELECT_CAL.get(data)) is None:
+        return data.encode()
+    return b"%06d" % values[reg]
+
+
+def _cmd_write_calibration(values: list[int], data: str) -> bytes:
+    """Handle "c": select a calibration or write the selected one."""
+    _select_or_write(values, data, REG_CAL_SEL, _SELECT_CAL)
+    return data.encode()
+
+
+def _cmd_read_penning_state(values: list[int], _data: str) -> bytes:
+    """Handle "I": read the Penning gauge state."""
+    return b"%06d" % values[REG_PENNING_STATE]
+
+
+def _cmd_write_penning_state(values: list[int], data: str) -> bytes:
+    """Handle "i": write the Penning gauge state."""
+    values[REG_PENNING_STATE] = int(data)
+    return data.encode()
+
+
+def _cmd_read_penning_sync(values: list[int], _data: str) -> bytes:
+    """Handle "W": read the Penning synchronization value."""
+    return b"%06d" % values[REG_PENNING_SYNC]
+
+
+def _cmd_write_penning_sync(values: list[int], data: str) -> bytes:
+    """Handle "w": write the Penning synchronization value."""
+    values[REG_PENNING_SYNC] = int(data)
+    return data.encode()
+
+
+def _cmd_adjust(values: list[int], data: str) -> bytes:
+    """Handle "j": select atmosphere/zero adjustment or apply the selected one."""
+    if data == "1":
+        values[REG_ATM_SEL] = 1
+        values[REG_ZERO_SEL] = 0
+    elif data == "0":
+        values[REG_ZERO_SEL] = 1
+        values[REG_ATM_SEL] = 0
+    elif values[REG_ATM_SEL] == 1:
+        values[REG_ATM_SEL] = 0
+        if data != "100023":
+            return b""
+        _write_pair(values, int(data), REG_P)
+    elif values[REG_ZERO_SEL] == 1:
+        values[REG_ZERO_SEL] = 0
+        if data not in ("000000", "000020"):
+            return b""
+        _write_pair(values, int(data), REG_P)
+    return data.encode()
+
+
+_CMD_TABLE: dict[str, CommandHandler] = {
+    "T": _cmd_gauge_type,
+    "M": _cmd_read_pressure,
+    "m": _cmd_write_pressure,
+    "S": _cmd_read_setpoint,
+    "s": _cmd_write_setpoint,
+    "C": _cmd_read_calibration,
+    "c": _cmd_write_calibration,
+    "I": _cmd_read_penning_state,
+    "i": _cmd_write_penning_state,
+    "W": _cmd_read_penning_sync,
+    "w": _cmd_write_penning_sync,
+    "j": _cmd_adjust,
+}
 
 
-# pylint: disable=too-many-branches,too-many-statements
 def parse_command(context: ModbusDeviceContext, command: str, data: str) -> bytes:
     """
     Parses and executes Thyracont-specific ASCII commands, returning a response.
@@ -181,88 +328,10 @@ def parse_command(context: ModbusDeviceContext, command: str, data: str) -> byte
     - "W": Reads Penning synchronization value (REG_PENNING_SYNC).
     - "w": Writes Penning synchronization value.
     - "j": Toggles atmosphere ("1") or zero ("0") adjustment, or applies adjustment with data.
+
+    Each command is handled by its own function, looked up in the `_CMD_TABLE` dictionary.
+    The holding register list is resolved once and handed to the handler.
     """
-    response_data = data.encode()
-    if command == "T":
-        response_data = b"MTM09D"
-    elif command == "M":
-        p_encoded = read_two_regs(context, REG_P)
-        response_data = f"{p_encoded:06d}".encode()
-    elif command == "m":
-        try:
-            write_two_regs(context, int(data), REG_P)
-        except ValueError:
-            pass
-    elif command == "S":
-        if data == "1":
-            p_encoded = read_two_regs(context, REG_SP1)
-        elif data == "2":
-            p_encoded = read_two_regs(context, REG_SP2)
-        else:
-            p_encoded = None
-        if p_encoded is not None:
-            response_data = f"{p_encoded:06d}".encode()
-    elif command == "s":
-        if data == "1":
-            context.store["h"].values[REG_SP_SEL] = 1
-        elif data == "2":
-            context.store["h"].values[REG_SP_SEL] = 2
-        else:
-            if context.store["h"].values[REG_SP_SEL] == 1:
-                write_two_regs(context, int(data), REG_SP1)
-                context.store["h"].values[REG_SP_SEL] = 0
-            elif context.store["h"].values[REG_SP_SEL] == 2:
-                write_two_regs(context, int(data), REG_SP2)
-                context.store["h"].values[REG_SP_SEL] = 0
-    elif command == "C":
-        if data == "1":
-            cal_encoded = context.store["h"].values[REG_CAL1]
-        elif data == "2":
-            cal_encoded = context.store["h"].values[REG_CAL2]
-        else:
-            cal_encoded = None
-        if cal_encoded is not None:
-            response_data = f"{cal_encoded:06d}".encode()
-    elif command == "c":
-        if data == "1":
-            context.store["h"].values[REG_CAL_SEL] = 1
-        elif data == "2":
-            context.store["h"].values[REG_CAL_SEL] = 2
-        else:
-            if context.store["h"].values[REG_CAL_SEL] == 1:
-                write_two_regs(context, int(data), REG_CAL1)
-                context.store["h"].values[REG_CAL_SEL] = 0
-            elif context.store["h"].values[REG_CAL_SEL] == 2:
-                write_two_regs(context, int(data), REG_CAL2)
-                context.store["h"].values[REG_CAL_SEL] = 0
-    elif command == "I":
-        penning_state = context.store["h"].values[REG_PENNING_STATE]
-        response_data = f"{penning_state:06d}".encode()
-    elif command == "i":
-        context.store["h"].values[REG_PENNING_STATE] = int(data)
-    elif command == "W":
-        penning_sync = context.store["h"].values[REG_PENNING_SYNC]
-        response_data = f"{penning_sync:06d}".encode()
-    elif command == "w":
-        context.store["h"].values[REG_PENNING_SYNC] = int(data)
-    elif command == "j":
-        if data == "1":
-            context.store["h"].values[REG_ATM_SEL] = 1
-            context.store["h"].values[REG_ZERO_SEL] = 0
-        elif data == "0":
-            context.store["h"].values[REG_ZERO_SEL] = 1
-            context.store["h"].values[REG_ATM_SEL] = 0
-        else:
-            if context.store["h"].values[REG_ATM_SEL] == 1:
-                context.store["h"].values[REG_ATM_SEL] = 0
-                if data != "100023":
-                    response_data = b""
-                else:
-                    write_two_regs(context, int(data), REG_P)
-            elif context.store["h"].values[REG_ZERO_SEL] == 1:
-                context.store["h"].values[REG_ZERO_SEL] = 0
-                if data not in ("000000", "000020"):
-                    response_data = b""
-                else:
-                    write_two_regs(context, int(data), REG_P)
-    return response_data
+    if (handler := _CMD_TABLE.get(command)) is not None:
+        return handler(context.store["h"].values, data)
+    return data.encode()
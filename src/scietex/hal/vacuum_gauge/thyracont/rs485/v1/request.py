@@ -65,7 +65,7 @@ class ThyracontRequest(ModbusPDU):
     def __init__(
         self,
         command: Optional[str] = None,
-        data: Optional[bytes] = None,
+        data: Optional[bytes | str] = None,
         dev_id=1,
         transaction_id=0,
     ) -> None:
@@ -73,16 +73,18 @@ class ThyracontRequest(ModbusPDU):
         Initialize an ThyracontRequest instance.
 
         Sets up the request with a command, data payload, slave ID, and transaction ID. The command
-        is limited to its first character, and the data is decoded from up to 6 bytes into a string.
-        The `function_code` is derived from the command’s first byte.
+        is limited to its first character, and the data is decoded from up to 6 bytes into a string,
+        with the same bytes kept in `registers`. The `function_code` is derived from the command’s
+        first byte.
 
         Parameters
         ----------
         command : Optional[str], optional
             The command string (e.g., "T", "M"); only the first character is used. Defaults to None,
             resulting in an empty command ("").
-        data : Optional[bytes], optional
-            The data payload in bytes (e.g., b"123456"); limited to 6 bytes and decoded to a string.
+        data : Optional[bytes | str], optional
+            The data payload (e.g., b"123456"); a string is encoded as ASCII first. Limited to
+            6 bytes and decoded to a string.
             Defaults to None, resulting in an empty data string ("").
         dev_id : int, optional
             The device (slave) ID. Defaults to 1.
@@ -97,7 +99,7 @@ class ThyracontRequest(ModbusPDU):
         self.__data: str = ""
         self.rtu_frame_size = 0
         if data is not None:
-            self.data = data[:6].decode()
+            self.decode(data.encode("ascii") if isinstance(data, str) else data)
 
     @property
     def data(self) -> str:
@@ -127,15 +129,18 @@ class ThyracontRequest(ModbusPDU):
         """
         Decode a byte string into the request’s data attribute.
 
-        Updates the `data` attribute by decoding the input bytes into a string. The command is not
-        modified, as it’s assumed to be set during initialization or handled by the framer.
+        Updates the `data` attribute by decoding the input bytes into a string and stores the same
+        bytes in the `registers` attribute as a list. The command is not modified, as it’s assumed
+        to be set during initialization or handled by the framer.
 
         Parameters
         ----------
         data : bytes
-            The byte string to decode (e.g., b"123456").
+            The byte string to decode (e.g., b"123456"); only the first 6 bytes are used.
         """
-        self.data = data.decode()
+        truncated = data[:6]
+        self.registers = list(truncated)
+        self.data = truncated.decode("ascii")
 
     async def update_datastore(self, context: ModbusDeviceContext) -> ModbusPDU:
         """
@@ -164,5 +169,4 @@ class ThyracontRequest(ModbusPDU):
             dev_id=self.dev_id,
             transaction_id=self.transaction_id,
         )
-        response.registers = list(data)
         return response
@@ -20,6 +20,7 @@ from functools import wraps
 from logging import Logger
 
 import serial
+from serial.rs485 import RS485Settings
 from pymodbus.pdu import ModbusPDU
 
 from scietex.hal.serial.config import (
@@ -144,6 +145,7 @@ class ThyracontVacuumGauge(RS485Client):
         logger: Optional[Logger] = None,
         timeout: Optional[float] = None,
         backend: Optional[str] = None,
+        rs485_mode: Optional[RS485Settings] = None,
     ) -> None:
         """
         Initialize an ThyracontVacuumGauge client instance.
@@ -166,6 +168,10 @@ class ThyracontVacuumGauge(RS485Client):
             The communication timeout in seconds. Defaults to 1.0 if None.
         backend : Optional[str], optional
             The communication backend ("pymodbus" or "pyserial"). Defaults to "pymodbus" if None.
+        rs485_mode : Optional[RS485Settings], optional
+            RS485 RTS control settings applied to the port opened by the "pyserial" backend.
+            On Linux these are passed to the kernel RS485 driver (`TIOCSRS485`), which switches
+            the transceiver without the user-space RTS toggling delay. Defaults to None.
         """
         _label = "Vacuum Gauge"
         if label is not None:  # Corrected logic to use provided label
@@ -185,6 +191,7 @@ class ThyracontVacuumGauge(RS485Client):
         self.backend = "pymodbus"
         if backend == "pyserial":
             self.backend = "pyserial"
+        self.rs485_mode: Optional[RS485Settings] = rs485_mode
 
     # pylint: disable=duplicate-code
     async def request_gauge(
@@ -235,8 +242,11 @@ class ThyracontVacuumGauge(RS485Client):
                 timeout=self.con_params.timeout,
                 inter_byte_timeout=inter_byte_timeout,
             )
+            if self.rs485_mode is not None:
+                con.rs485_mode = self.rs485_mode
             con.write(encoded_frame)
-            serial_response = con.readline()
+            # Frames end with CR, read up to it instead of waiting for a newline or timeout.
+            serial_response = con.read_until(custom_framer.END)
             self.logger.debug("SERIAL READ: %s", serial_response)
             parsed = self._parse_response(serial_response)
             result = parsed["data"]
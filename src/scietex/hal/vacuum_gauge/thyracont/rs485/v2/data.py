@@ -32,12 +32,26 @@ class AccessCode(Enum):
         Raises:
             ValueError: If the integer value does not match any supported access code.
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        raise ValueError(
-            f"Unknown access code: {value}. Supported values are: {[m.value for m in cls]}"
-        )
+        try:
+            return _ACCESS_CODE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown access code: {value}. Supported values are: {_ACCESS_CODE_SUPPORTED}"
+            ) from None
+
+
+_ACCESS_CODE_BY_VALUE: dict[int, AccessCode] = {m.value: m for m in AccessCode}
+_ACCESS_CODE_SUPPORTED = str(list(_ACCESS_CODE_BY_VALUE))
+
+# Access code value by its on-wire digit; only the receive codes 6 and 7 are not shifted by one.
+_ACCESS_CODE_BY_DIGIT: tuple[int, ...] = (-1, 0, 1, 2, 3, 4, 6, 7, 7, 8)
+
+# Access code member by the raw on-wire byte, resolving a frame header in a single lookup.
+_ACCESS_CODE_BY_BYTE: dict[int, AccessCode] = {
+    48 + digit: _ACCESS_CODE_BY_VALUE[value]
+    for digit, value in enumerate(_ACCESS_CODE_BY_DIGIT)
+    if value in _ACCESS_CODE_BY_VALUE
+}
 
 
 class ErrorMessage(Enum):
@@ -68,29 +82,34 @@ class ErrorMessage(Enum):
         Raises:
             ValueError: If the string value does not match any supported error message.
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        raise ValueError(
-            f"Unknown error message: {value}. Supported values are: {[m.value for m in cls]}"
-        )
+        try:
+            return _ERROR_MESSAGE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown error message: {value}. Supported values are: {_ERROR_MESSAGE_SUPPORTED}"
+            ) from None
 
     def description(self) -> str:
         """Error description."""
-        description: dict[str, str] = {
-            "NO_DEF": "Command is not valid (not defined) for device.",
-            "_LOGIC": "Access Code is not valid or execution of command is not logical.",
-            "_RANGE": "Value in send request is out of range.",
-            "ERROR1": "Sensor is defect or stacked out.",
-            "SYNTAX": "Command is valid, but the syntax in data is wrong "
-            "or the selected mode in data is not valid for your device.",
-            "LENGTH": "Command is valid, but the length of data is out of expected range.",
-            "_CD_RE": "Calibration data read error.",
-            "_EP_RE": "EEPROM Read Error.",
-            "_UNSUP": "Unsupported Data (not valid value).",
-            "_SEDIS": "Sensor element disabled.",
-        }
-        return description[self.value]
+        return _ERROR_DESCRIPTIONS[self]
+
+
+_ERROR_MESSAGE_BY_VALUE: dict[str, ErrorMessage] = {m.value: m for m in ErrorMessage}
+_ERROR_MESSAGE_SUPPORTED = str(list(_ERROR_MESSAGE_BY_VALUE))
+
+_ERROR_DESCRIPTIONS: dict[ErrorMessage, str] = {
+    ErrorMessage.NO_DEF: "Command is not valid (not defined) for device.",
+    ErrorMessage.LOGIC: "Access Code is not valid or execution of command is not logical.",
+    ErrorMessage.RANGE: "Value in send request is out of range.",
+    ErrorMessage.SENSOR_ERROR: "Sensor is defect or stacked out.",
+    ErrorMessage.SYNTAX: "Command is valid, but the syntax in data is wrong "
+    "or the selected mode in data is not valid for your device.",
+    ErrorMessage.LENGTH: "Command is valid, but the length of data is out of expected range.",
+    ErrorMessage.CD_RE: "Calibration data read error.",
+    ErrorMessage.EP_RE: "EEPROM Read Error.",
+    ErrorMessage.UNSUPPORTED_DATA: "Unsupported Data (not valid value).",
+    ErrorMessage.SENSOR_DISABLED: "Sensor element disabled.",
+}
 
 
 class Sensor(Enum):
@@ -118,12 +137,16 @@ class Sensor(Enum):
         Raises:
             ValueError: If the integer value does not match any sensor code.
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        raise ValueError(
-            f"Unknown sensor code: {value}. Supported values are: {[m.value for m in cls]}"
-        )
+        try:
+            return _SENSOR_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown sensor code: {value}. Supported values are: {_SENSOR_SUPPORTED}"
+            ) from None
+
+
+_SENSOR_BY_VALUE: dict[int, Sensor] = {m.value: m for m in Sensor}
+_SENSOR_SUPPORTED = str(list(_SENSOR_BY_VALUE))
 
 
 class StreamingMode(Enum):
@@ -163,12 +186,16 @@ class DisplayUnits(Enum):
         Raises:
             ValueError: If the string value does not match any supported units.
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        raise ValueError(
-            f"Unknown display units: {value}. Supported values are: {[m.value for m in cls]}"
-        )
+        try:
+            return _DISPLAY_UNITS_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown display units: {value}. Supported values are: {_DISPLAY_UNITS_SUPPORTED}"
+            ) from None
+
+
+_DISPLAY_UNITS_BY_VALUE: dict[str, DisplayUnits] = {m.value: m for m in DisplayUnits}
+_DISPLAY_UNITS_SUPPORTED = str(list(_DISPLAY_UNITS_BY_VALUE))
 
 
 class CathodeControlMode(Enum):
@@ -178,6 +205,16 @@ class CathodeControlMode(Enum):
     AUTO = 1
 
 
+def _d1(data: bytes, i: int) -> int:
+    """Decode one ASCII digit at position `i` of a bytes frame."""
+    return data[i] - 48
+
+
+def _d2(data: bytes, i: int) -> int:
+    """Decode two ASCII digits starting at position `i` of a bytes frame."""
+    return (data[i] - 48) * 10 + data[i + 1] - 48
+
+
 def decode_float(data: str) -> Optional[float]:
     """Decode string to float value."""
     if data is None or len(data) == 0:
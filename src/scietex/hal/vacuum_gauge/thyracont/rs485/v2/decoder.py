@@ -17,7 +17,7 @@ from pymodbus import ModbusException
 from pymodbus.pdu import ModbusPDU
 
 from ..decoder import ThyracontRS485DecodePDU
-from .data import AccessCode
+from .data import _ACCESS_CODE_BY_BYTE
 
 
 class ThyracontDecodePDU(ThyracontRS485DecodePDU):
@@ -34,7 +34,7 @@ class ThyracontDecodePDU(ThyracontRS485DecodePDU):
         Creates an `ThyracontRequest` instance with the command and data, then decodes the data
         portion into the instance’s `data` attribute. The frame’s bytes (excluding the command)
         are also stored in the `registers` attribute as a list. Returns None if decoding fails
-        due to an empty frame or exceptions.
+        due to a short or malformed frame.
 
         Parameters
         ----------
@@ -53,27 +53,22 @@ class ThyracontDecodePDU(ThyracontRS485DecodePDU):
             Caught internally if PDU instantiation or decoding fails (returns None).
         ValueError
             Caught internally if decoding the command or data fails (returns None).
-        IndexError
-            Caught internally if the frame is too short (returns None).
         """
-        if not frame:
+        # Shortest valid frame is the bare header: access code, command and data length.
+        if len(frame) < 5:
+            return None
+        if not (pdu_class := self.lookupPduClass(frame)):
+            return None
+        if (access_code := _ACCESS_CODE_BY_BYTE.get(frame[0])) is None:
             return None
         try:
-            access_code_int: int = int(chr(frame[0]))
-            if access_code_int not in (6, 7):
-                access_code_int -= 1
-            access_code: AccessCode = AccessCode.from_int(access_code_int)
-            command: str = frame[1:3].decode()
-            pdu_class = self.lookupPduClass(frame)
-            if pdu_class is None:
-                return None
             pdu = pdu_class(
                 access_code=access_code,  # type: ignore[call-arg]
-                command=command,  # type: ignore[call-arg]
+                command=frame[1:3].decode(),  # type: ignore[call-arg]
                 data=frame,  # type: ignore[call-arg]
             )
             pdu.decode(frame)
-            pdu.registers = list(frame)[3:]
-            return pdu
-        except (ModbusException, ValueError, IndexError):
+        except (ModbusException, ValueError):
             return None
+        pdu.registers = list(frame[3:])
+        return pdu
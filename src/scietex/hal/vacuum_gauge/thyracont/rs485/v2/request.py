@@ -13,15 +13,26 @@ Classes:
         execution and response generation.
 """
 
+from functools import lru_cache
 from typing import Optional
+import struct
 
 from pymodbus.pdu import ModbusPDU
 from pymodbus.datastore import ModbusDeviceContext
 
-from .data import AccessCode
+from .data import AccessCode, _ACCESS_CODE_BY_DIGIT, _d1, _d2
 
 # from .emulation_utils import parse_command
 
+# Fixed-size frame header: access code (1 digit), command (2 chars), data length (2 digits).
+_HEADER = struct.Struct("1s2s2s")
+
+
+@lru_cache(maxsize=64)
+def _cmd_bytes(command: str) -> bytes:
+    """Return ASCII bytes of a command, cached since a gauge only knows a few commands."""
+    return command.encode("ascii")
+
 
 class ThyracontRequest(ModbusPDU):
     """
@@ -40,9 +51,9 @@ class ThyracontRequest(ModbusPDU):
     rtu_frame_size : int
         The size of the data payload in bytes (up to 6).
     command : str
-        The single-character command (e.g., "T", "M"), extracted from the input `command`.
-    data : str
-        The data payload as a string, decoded from up to 6 bytes of input `data`.
+        The two-character command (e.g., "MV", "AV"), extracted from the input `command`.
+    data : Optional[str]
+        The data payload as a string, stored as ASCII bytes of up to 99 bytes.
     dev_id : int
         The device (slave) ID, inherited from `ModbusPDU`.
     transaction_id : int
@@ -79,17 +90,18 @@ class ThyracontRequest(ModbusPDU):
         Initialize an ThyracontRequest instance.
 
         Sets up the request with a command, data payload, slave ID, and transaction ID. The command
-        is limited to its first character, and the data is decoded from up to 6 bytes into a string.
+        is limited to its first two characters, and the data is stored as bytes.
         The `function_code` is derived from the command’s first byte.
 
         Parameters
         ----------
         command : Optional[str], optional
-            The command string (e.g., "T", "M"); only the first character is used. Defaults to None,
-            resulting in an empty command ("").
+            The command string (e.g., "MV", "AV"); only the first two characters are used. Defaults
+            to None, resulting in an empty command ("").
         data : Optional[bytes], optional
-            The data payload in bytes (e.g., b"123456"); limited to 6 bytes and decoded to a string.
-            Defaults to None, resulting in an empty data string ("").
+            The ASCII data payload (e.g., b"123456"), stored as bytes; up to 99 bytes, which is
+            enforced by `encode`. The `data` property returns it as `Optional[str]`. Defaults to
+            None, resulting in an empty data string ("").
         dev_id : int, optional
             The device (slave) ID. Defaults to 1.
         transaction_id : int, optional
@@ -98,42 +110,56 @@ class ThyracontRequest(ModbusPDU):
         super().__init__(dev_id=dev_id, transaction_id=transaction_id)
         if access_code is not None:
             self.function_code = access_code.value
-        self.command: str = ""
-        if command is not None and len(command) > 1:
-            self.command = command[:2]
-        self.__data: str = ""
+        self.command: str = (command or "")[:2]
+        self.__data: Optional[bytes] = b""
         self.rtu_frame_size = 0
         if data is not None:
-            self.data = data.decode()
+            self.data = data
 
     @property
-    def data(self) -> str:
-        """Data property."""
-        return self.__data
+    def data(self) -> Optional[str]:
+        """Data property, kept as ASCII bytes internally and decoded on access."""
+        return None if self.__data is None else self.__data.decode("ascii")
 
     @data.setter
-    def data(self, new_data: str) -> None:
+    def data(self, new_data: Optional[str | bytes]) -> None:
+        # Non-ASCII data is rejected here, so that reading `data` back can not fail.
+        if isinstance(new_data, str):
+            new_data = new_data.encode("ascii")
+        elif new_data is not None and not new_data.isascii():
+            raise ValueError(f"Data is not ASCII: {new_data!r}")
+        if new_data == self.__data:
+            return  # rtu_frame_size already matches the stored data.
         self.__data = new_data
-        try:
-            self.rtu_frame_size = len(self.__data)
-        except TypeError:
-            self.rtu_frame_size = 0
+        self.rtu_frame_size = 0 if new_data is None else len(new_data)
 
     def encode(self) -> bytes:
         """
         Encode the request data into bytes.
 
-        Converts the `data` attribute (a string) into a byte string for transmission. The command
-        is not included in the encoded output, as it’s handled separately by the framer.
+        Packs the access code, command, data length and the stored data bytes for transmission;
+        the data is already kept as bytes, so no string conversion takes place.
 
         Returns
         -------
         bytes
             The encoded data payload (e.g., b"123456").
+
+        Raises
+        ------
+        ValueError
+            If the data does not fit the two-digit length field.
         """
-        payload: bytes = f"{self.function_code:1d}".encode() + self.command.encode()
-        payload += f"{len(self.data):02d}".encode() + self.data.encode()
-        return payload
+        data = self.__data or b""
+        size = len(data)
+        if size > 99:
+            raise ValueError(f"Data is too long ({size} > 99 bytes): {data!r}")
+        payload = bytearray((48 + self.function_code,))  # single ASCII digit access code.
+        payload += _cmd_bytes(self.command)
+        payload.append(48 + size // 10)  # two ASCII digits data length.
+        payload.append(48 + size % 10)
+        payload += data
+        return bytes(payload)
 
     def decode(self, data: bytes) -> None:
         """
@@ -146,13 +172,22 @@ class ThyracontRequest(ModbusPDU):
         ----------
         data : bytes
             The byte string to decode (e.g., b"123456").
+
+        Raises
+        ------
+        ValueError
+            If the frame is shorter than its header, the header is not numeric or the data is not
+            ASCII.
         """
-        self.function_code = int(data[0:1], 10)
-        if self.function_code not in (6, 7):
-            self.function_code -= 1
-        self.command = data[1:3].decode()
-        self.rtu_frame_size = int(data[3:5], 10)
-        self.data = data[5 : 5 + self.rtu_frame_size].decode()
+        try:
+            access_code, command, size = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Frame is too short: {data!r}") from e
+        if not (access_code.isdigit() and size.isdigit()):
+            raise ValueError(f"Invalid frame header: {data[:5]!r}")
+        self.function_code = _ACCESS_CODE_BY_DIGIT[_d1(access_code, 0)]
+        self.command = command.decode()
+        self.data = bytes(data[5 : 5 + _d2(size, 0)])
 
     # pylint: disable=duplicate-code
     async def update_datastore(self, context: ModbusDeviceContext) -> ModbusPDU:
@@ -176,13 +211,40 @@ class ThyracontRequest(ModbusPDU):
             list of response bytes.
         """
         # data: bytes = parse_command(context, self.command, self.data)
-        data: bytes = self.data.encode()
-        response = ThyracontRequest(
-            AccessCode.from_int(self.function_code + 1),
-            self.command,
-            data,
-            dev_id=self.dev_id,
-            transaction_id=self.transaction_id,
-        )
+        data: bytes = self.__data or b""
+        return self._fast_response(self, self.function_code + 1, data)
+
+    @classmethod
+    def _fast_response(
+        cls, src: "ThyracontRequest", function_code: int, data: bytes
+    ) -> "ThyracontRequest":
+        """
+        Build a response PDU for `src` without running `__init__` and the `data` setter.
+
+        Parameters
+        ----------
+        src : ThyracontRequest
+            The request being answered; its command, device ID and transaction ID are reused.
+        function_code : int
+            The access code of the response, validated through `AccessCode`.
+        data : bytes
+            The response data payload.
+
+        Returns
+        -------
+        ThyracontRequest
+            The response PDU with `registers` set to the list of response bytes.
+
+        Raises
+        ------
+        ValueError
+            If `function_code` is not a supported access code.
+        """
+        response = cls.__new__(cls)
+        ModbusPDU.__init__(response, dev_id=src.dev_id, transaction_id=src.transaction_id)
+        response.function_code = AccessCode.from_int(function_code).value
+        response.command = src.command
+        response.__data = data  # pylint: disable=unused-private-member
+        response.rtu_frame_size = len(data)
         response.registers = list(data)
         return response
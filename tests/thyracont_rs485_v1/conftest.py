@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the scietex.hal.vacuum_gauge.Thyracont.rs485.v1 client tests.
+
+Each test module gets its own virtual serial pair, so a module that stops its emulator does not
+affect the others.
+"""
+
+import logging
+import pytest
+
+# pylint: disable=ungrouped-imports
+from scietex.hal.serial.config import ModbusSerialConnectionConfig
+from scietex.hal.serial import VirtualSerialPair
+
+try:
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v1.client import ThyracontVacuumGauge
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v1.emulation import ThyracontEmulator
+except ModuleNotFoundError:
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v1.client import ThyracontVacuumGauge
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v1.emulation import ThyracontEmulator
+
+
+@pytest.fixture(scope="module")
+def logger_fixture():
+    """Provide a logger for debugging."""
+    return logging.getLogger("test_logger")
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture(scope="module")
+def vsp_fixture(logger_fixture):
+    """Start Virtual Serial Pair."""
+    vsp = VirtualSerialPair(logger=logger_fixture)
+    vsp.start()
+    yield vsp
+    vsp.stop()
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture(scope="module")
+def modbus_config(vsp_fixture):
+    """Provide a Modbus serial connection configuration."""
+    return [
+        ModbusSerialConnectionConfig(
+            port=vsp_port,
+            baudrate=9600,
+            bytesize=8,
+            parity="N",
+            stopbits=1,
+            timeout=1.0,
+        )
+        for vsp_port in vsp_fixture.serial_ports
+    ]
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture(scope="module")
+def make_emulator(modbus_config, logger_fixture):
+    """Provide a factory for a (not yet started) emulator on the first serial port."""
+
+    def factory() -> ThyracontEmulator:
+        return ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
+
+    return factory
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture(scope="module")
+def make_client(modbus_config, logger_fixture):
+    """Provide a factory for a gauge client on the second serial port."""
+
+    def factory(backend: str = "pymodbus") -> ThyracontVacuumGauge:
+        return ThyracontVacuumGauge(
+            connection_config=modbus_config[1],
+            address=1,
+            label="Test Gauge",
+            logger=logger_fixture,
+            timeout=1.0,
+            backend=backend,
+        )
+
+    return factory
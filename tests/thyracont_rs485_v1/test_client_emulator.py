@@ -6,140 +6,72 @@ correct communication over the Thyracont RS485 protocol for pressure measurement
 setpoints, and Penning gauge control using both 'pymodbus' and 'pyserial' backends.
 """
 
-import logging
+import asyncio
 import pytest
+import pytest_asyncio
 
-# pylint: disable=ungrouped-imports
-from scietex.hal.serial.config import ModbusSerialConnectionConfig
-from scietex.hal.serial import VirtualSerialPair
+# All tests in this module share one emulator and client on the session event loop; the
+# emulator state is reset before every test instead of restarting the serial server.
+# The serial pair and the emulator/client factories come from conftest.py.
 
-try:
-    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v1.client import ThyracontVacuumGauge
-    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v1.emulation import ThyracontEmulator
-except ModuleNotFoundError:
-    from scietex.hal.vacuum_gauge.thyracont.rs485.v1.client import ThyracontVacuumGauge
-    from scietex.hal.vacuum_gauge.thyracont.rs485.v1.emulation import ThyracontEmulator
 
-
-# Fixtures
-@pytest.fixture
-def logger_fixture():
-    """Provide a logger for debugging."""
-    return logging.getLogger("test_logger")
+# pylint: disable=redefined-outer-name
+@pytest_asyncio.fixture(scope="module")
+async def emulator(make_emulator):
+    """Start the gauge emulator once for the module."""
+    emulator = make_emulator()
+    await emulator.start()
+    yield emulator
+    await emulator.stop()
 
 
 # pylint: disable=redefined-outer-name
-@pytest.fixture
-def vsp_fixture(logger_fixture):
-    """Start Virtual Serial Pair."""
-    vsp = VirtualSerialPair(logger=logger_fixture)
-    vsp.start()
-    yield vsp
-    vsp.stop()
+@pytest_asyncio.fixture(scope="module")
+async def client(make_client):
+    """Provide a gauge client connected to the emulator."""
+    return make_client()
 
 
 # pylint: disable=redefined-outer-name
-@pytest.fixture
-def modbus_config(vsp_fixture):
-    """Provide a Modbus serial connection configuration."""
-    return [
-        ModbusSerialConnectionConfig(
-            port=vsp_port,
-            baudrate=9600,
-            bytesize=8,
-            parity="N",
-            stopbits=1,
-            timeout=1.0,
-        )
-        for vsp_port in vsp_fixture.serial_ports
-    ]
-
-
-# Helper to run tests with both backends
-# pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_get_model(modbus_config, logger_fixture):
-    """Test retrieving the gauge model."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
+@pytest.fixture(autouse=True)
+def reset_emulator(emulator):
+    """Restore emulator defaults before each test."""
+    emulator.pressure = 1000.0
+    emulator.sp1 = 0.0
+    emulator.sp2 = 0.0
+    emulator.cal1 = 1.0
+    emulator.cal2 = 1.0
+    emulator.penning_state = False
+    emulator.penning_sync = True
 
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
 
+# pylint: disable=redefined-outer-name
+async def test_get_model(client):
+    """Test retrieving the gauge model."""
     model = await client.get_model()
     assert model == "MTM09D"
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_measure(modbus_config, logger_fixture):
+async def test_measure(emulator, client):
     """Test measuring the default pressure."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
     emulator.pressure = 1000.0  # Default value set in emulator
     pressure = await client.measure()
     assert pressure == pytest.approx(1000.0)
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_pressure(modbus_config, logger_fixture):
+async def test_set_pressure(emulator, client):
     """Test setting and reading back a pressure value."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     new_pressure = 1.23e-3
     result = await client.set_pressure(new_pressure)
     assert result == pytest.approx(new_pressure)
     assert emulator.pressure == pytest.approx(new_pressure)
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_get_calibration(modbus_config, logger_fixture):
+async def test_get_calibration(emulator, client):
     """Test retrieving calibration values."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     emulator.cal1 = 1.0  # Default value
     emulator.cal2 = 1.5
     cal1 = await client.get_calibration(1)
@@ -147,49 +79,19 @@ async def test_get_calibration(modbus_config, logger_fixture):
     assert cal1 == 1.0
     assert cal2 == 1.5
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_calibration(modbus_config, logger_fixture):
+async def test_set_calibration(emulator, client):
     """Test setting a calibration value."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     new_cal = 1.23
     result = await client.set_calibration(cal_n=1, value=new_cal)
     assert result == new_cal
     assert emulator.cal1 == new_cal
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_get_setpoint(modbus_config, logger_fixture):
+async def test_get_setpoint(emulator, client):
     """Test retrieving setpoint values."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     emulator.sp1 = 0.987
     emulator.sp2 = 12.34
     sp1 = await client.get_setpoint(1)
@@ -197,203 +99,108 @@ async def test_get_setpoint(modbus_config, logger_fixture):
     assert sp1 == pytest.approx(0.987)
     assert sp2 == pytest.approx(12.34)
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_setpoint(modbus_config, logger_fixture):
+async def test_set_setpoint(emulator, client):
     """Test setting a setpoint value."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     new_sp = 5.67
     result = await client.set_setpoint(sp_n=2, pressure=new_sp)
     assert result == pytest.approx(new_sp)
     assert emulator.sp2 == pytest.approx(new_sp)
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_atmosphere(modbus_config, logger_fixture):
+async def test_set_atmosphere(emulator, client):
     """Test setting atmosphere adjustment."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     result = await client.set_atmosphere()
     assert result == pytest.approx(1000.0)
     assert emulator.pressure == pytest.approx(1000.0)
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_zero(modbus_config, logger_fixture):
+async def test_set_zero(emulator, client):
     """Test setting zero adjustment."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     result = await client.set_zero()
     assert result == 0.0
     assert emulator.pressure == 0.0
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_get_penning_state(modbus_config, logger_fixture):
+async def test_get_penning_state(emulator, client):
     """Test retrieving Penning gauge state."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     emulator.penning_state = True
     state = await client.get_penning_state()
     assert state is True
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_penning_state(modbus_config, logger_fixture):
+async def test_set_penning_state(emulator, client):
     """Test setting Penning gauge state."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     result = await client.set_penning_state(False)
     assert result is False
     assert emulator.penning_state is False
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_get_penning_sync(modbus_config, logger_fixture):
+async def test_get_penning_sync(emulator, client):
     """Test retrieving Penning synchronization state."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     emulator.penning_sync = True  # Default value
     state = await client.get_penning_sync()
     assert state is True
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_set_penning_sync(modbus_config, logger_fixture):
+async def test_set_penning_sync(emulator, client):
     """Test setting Penning synchronization state."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     result = await client.set_penning_sync(False)
     assert result is False
     assert emulator.penning_sync is False
 
-    await emulator.stop()
-
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_read_data(modbus_config, logger_fixture):
+async def test_read_data(emulator, client):
     """Test reading gauge data dictionary."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
     emulator.pressure = 0.00123
     data = await client.read_data()
     assert "pressure" in data
     assert data["pressure"] == pytest.approx(0.00123)
 
-    await emulator.stop()
+
+# pylint: disable=redefined-outer-name
+async def test_read_many(emulator, client):
+    """Test batched reading of several gauge values."""
+    emulator.pressure = 0.00123
+    emulator.sp1 = 1.0e-2
+    emulator.cal2 = 0.99
+    emulator.penning_state = True
+    data = await client.read_many(["model", "pressure", "sp1", "cal2", "penning_state"])
+    assert data["model"] == "MTM09D"
+    assert data["pressure"] == pytest.approx(0.00123)
+    assert data["sp1"] == pytest.approx(1.0e-2)
+    assert data["cal2"] == pytest.approx(0.99)
+    assert data["penning_state"] is True
+
+    with pytest.raises(ValueError):
+        await client.read_many(["pressure", "unknown"])
+
+
+# pylint: disable=redefined-outer-name
+async def test_concurrent_requests(emulator, client):
+    """Test concurrent requests are serialized on the bus."""
+    emulator.pressure = 0.00123
+    emulator.sp2 = 5.0e-3
+    model, pressure, sp2 = await asyncio.gather(
+        client.get_model(), client.measure(), client.get_setpoint(2)
+    )
+    assert model == "MTM09D"
+    assert pressure == pytest.approx(0.00123)
+    assert sp2 == pytest.approx(5.0e-3)
 
 
 # Emulator-specific property tests
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_emulator_properties(modbus_config, logger_fixture):
+async def test_emulator_properties(emulator):
     """Test emulator property getters and setters."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
     # Pressure
     emulator.pressure = 1.23e-3
     assert emulator.pressure == pytest.approx(1.23e-3)
@@ -413,32 +220,6 @@ async def test_emulator_properties(modbus_config, logger_fixture):
     emulator.penning_sync = True
     assert emulator.penning_sync is True
 
-    await emulator.stop()
-
-
-# Client-specific edge case: timeout handling
-# pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
-async def test_client_timeout(modbus_config, logger_fixture):
-    """Test client handling of request timeout."""
-    emulator = ThyracontEmulator(con_params=modbus_config[0], logger=logger_fixture, address=1)
-    await emulator.start()
-
-    client: ThyracontVacuumGauge = ThyracontVacuumGauge(
-        connection_config=modbus_config[1],
-        address=1,
-        label="Test Gauge",
-        logger=logger_fixture,
-        timeout=1.0,
-        backend="pymodbus",
-    )
-
-    client.timeout = 0.01  # Very short timeout
-    # Simulate a non-responsive emulator by not awaiting its response properly
-    await emulator.stop()  # Stop emulator to force timeout
-    result = await client.measure()
-    assert result is None
-
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,47 @@
+"""
+Tests for the 'pyserial' backend of scietex.hal.vacuum_gauge.Thyracont.rs485.v1.client module.
+
+The client opens the serial port directly, so it runs with its own virtual serial pair and
+emulator (see conftest.py) instead of the ones used by `test_client_emulator`.
+"""
+
+import pytest
+import pytest_asyncio
+
+
+# pylint: disable=redefined-outer-name
+@pytest_asyncio.fixture(scope="module")
+async def serial_emulator(make_emulator):
+    """Start the gauge emulator once for the module."""
+    serial_emulator = make_emulator()
+    await serial_emulator.start()
+    yield serial_emulator
+    await serial_emulator.stop()
+
+
+# pylint: disable=redefined-outer-name
+async def test_pyserial_request(serial_emulator, make_client):
+    """Test single requests over the pyserial backend."""
+    serial_emulator.pressure = 0.00123
+    client = make_client(backend="pyserial")
+    assert client.backend == "pyserial"
+    assert await client.get_model() == "MTM09D"
+    assert await client.measure() == pytest.approx(0.00123)
+    assert await client.set_penning_state(True) is True
+    assert serial_emulator.penning_state is True
+
+
+# pylint: disable=redefined-outer-name
+async def test_pyserial_read_many(serial_emulator, make_client):
+    """Test batched reading over one pyserial connection."""
+    serial_emulator.pressure = 5.0e-4
+    serial_emulator.sp2 = 2.0e-3
+    serial_emulator.cal1 = 1.05
+    serial_emulator.penning_sync = False
+    client = make_client(backend="pyserial")
+    data = await client.read_many(["pressure", "sp2", "cal1", "penning_sync", "model"])
+    assert data["pressure"] == pytest.approx(5.0e-4)
+    assert data["sp2"] == pytest.approx(2.0e-3)
+    assert data["cal1"] == pytest.approx(1.05)
+    assert data["penning_sync"] is False
+    assert data["model"] == "MTM09D"
@@ -0,0 +1,100 @@
+"""
+Serial port handling tests for the scietex.hal.vacuum_gauge.Thyracont.rs485.v1.client module.
+
+The port opened by the 'pyserial' backend is replaced with a fake one, so the tests can check
+the RS485 settings applied to it and how the reply is read, which a virtual serial pair can not
+show.
+"""
+
+from typing import Optional
+
+import pytest
+from serial.rs485 import RS485Settings
+
+# pylint: disable=ungrouped-imports
+from scietex.hal.serial.config import SerialConnectionConfig
+
+try:
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.checksum import calc_checksum
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v1 import client as client_module
+except ModuleNotFoundError:
+    from scietex.hal.vacuum_gauge.thyracont.rs485.checksum import calc_checksum
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v1 import client as client_module
+
+
+class FakePort:
+    """Serial port answering every write with a canned reply."""
+
+    reply: bytes = b""
+    opened: list["FakePort"] = []
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.rs485_mode: Optional[RS485Settings] = None
+        self.written: list[bytes] = []
+        self.terminators: list[bytes] = []
+        self.buffer = b""
+        self.closed = False
+        FakePort.opened.append(self)
+
+    def write(self, frame: bytes) -> None:
+        """Record the frame and queue the reply followed by bytes of the next frame."""
+        self.written.append(frame)
+        self.buffer += FakePort.reply + b"002"
+
+    def read_until(self, expected: bytes) -> bytes:
+        """Return the buffered bytes up to and including the terminator."""
+        self.terminators.append(expected)
+        head, sep, self.buffer = self.buffer.partition(expected)
+        return head + sep
+
+    def close(self) -> None:
+        """Mark the port closed."""
+        self.closed = True
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def fake_port(monkeypatch):
+    """Replace serial.Serial in the client module with FakePort."""
+    msg = b"001TMTM09D"
+    FakePort.reply = msg + bytes([calc_checksum(msg)]) + b"\r"
+    FakePort.opened = []
+    monkeypatch.setattr(client_module.serial, "Serial", FakePort)
+    return FakePort
+
+
+def make_gauge(rs485_mode: Optional[RS485Settings] = None):
+    """Create a pyserial backend client for the fake port."""
+    return client_module.ThyracontVacuumGauge(
+        connection_config=SerialConnectionConfig(port="/dev/null", baudrate=9600),
+        address=1,
+        backend="pyserial",
+        rs485_mode=rs485_mode,
+    )
+
+
+# pylint: disable=redefined-outer-name
+async def test_rs485_mode_applied(fake_port):
+    """Test RS485 settings are set on the opened port."""
+    settings = RS485Settings(rts_level_for_tx=True, rts_level_for_rx=False)
+    assert await make_gauge(settings).get_model() == "MTM09D"
+    assert fake_port.opened[0].rs485_mode is settings
+    assert fake_port.opened[0].closed
+
+
+# pylint: disable=redefined-outer-name
+async def test_rs485_mode_not_set(fake_port):
+    """Test the port RS485 settings are left untouched by default."""
+    assert await make_gauge().get_model() == "MTM09D"
+    assert fake_port.opened[0].rs485_mode is None
+
+
+# pylint: disable=redefined-outer-name
+async def test_reply_read_until_cr(fake_port):
+    """Test the reply is read up to CR and the following bytes are left unread."""
+    assert await make_gauge().get_model() == "MTM09D"
+    port = fake_port.opened[0]
+    assert port.written == [b"001Te\r"]
+    assert port.terminators == [b"\r"]
+    assert port.buffer == b"002"
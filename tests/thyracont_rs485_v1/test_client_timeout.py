@@ -0,0 +1,27 @@
+"""
+Timeout test for scietex.hal.vacuum_gauge.Thyracont.rs485.v1.client module.
+
+This test stops the emulator it talks to, so it runs with its own virtual serial pair and
+emulator (see conftest.py) instead of the ones used by `test_client_emulator`.
+"""
+
+import pytest
+
+
+# Client-specific edge case: timeout handling
+async def test_client_timeout(make_emulator, make_client):
+    """Test client handling of request timeout."""
+    emulator = make_emulator()
+    await emulator.start()
+
+    client = make_client()
+
+    client.timeout = 0.01  # Very short timeout
+    # Simulate a non-responsive emulator by not awaiting its response properly
+    await emulator.stop()  # Stop emulator to force timeout
+    result = await client.measure()
+    assert result is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -39,6 +39,21 @@ def test_f_exp_positive():
     assert f_exp(1000.0) == 3  # 1.0e3
 
 
+def test_f_exp_powers_of_ten():
+    """Test exponent of floats nearest to a power of ten whose binary value lies just below it."""
+    assert f_exp(1e-6) == -6
+    assert f_exp(1e-7) == -7
+    assert f_exp(1e24) == 24
+    assert f_exp(-1e-6) == -6
+
+
+def test_f_exp_extremes():
+    """Test exponent of finite floats beyond the table of powers of ten."""
+    assert f_exp(1.7976931348623157e308) == 308  # largest float
+    assert f_exp(5e-324) == -324  # smallest subnormal float
+    assert f_exp(-2.5e-310) == -310
+
+
 def test_f_exp_zero():
     """Test exponent calculation for zero."""
     assert f_exp(0.0) == 0  # 0.0e0, but Decimal gives -1 due to normalization
@@ -61,6 +76,15 @@ def test_f_man_positive():
     assert_almost_equal(f_man(1000.0), Decimal("1"))
 
 
+def test_f_man_exact():
+    """Test mantissa is taken from the shortest representation, including the extremes."""
+    assert f_man(123.45) == Decimal("1.2345")
+    assert f_man(1e-6) == Decimal(1)
+    assert f_man(1e-7) == Decimal(1)
+    assert f_man(1.7976931348623157e308) == Decimal("1.7976931348623157")
+    assert f_man(5e-324) == Decimal(5)
+
+
 def test_f_man_zero():
     """Test mantissa calculation for zero."""
     assert f_man(0.0) == Decimal("0")
@@ -88,6 +112,18 @@ def test_pressure_encode_edge_cases():
     assert _pressure_encode(9999.0) == "999923"  # 9.999e3, exp = 3 + 20 = 23
 
 
+def test_pressure_encode_powers_of_ten():
+    """Test pressure encoding keeps 6 digits for exact powers of ten."""
+    assert _pressure_encode(1e-6) == "100014"
+    assert _pressure_encode(1e-7) == "100013"
+
+
+def test_pressure_encode_mantissa_carry():
+    """Test a mantissa rounded up to 10000 carries into the exponent."""
+    assert _pressure_encode(9.9996) == "100021"
+    assert _pressure_encode(9.9996e-3) == "100018"
+
+
 def test_pressure_encode_invalid():
     """Test pressure encoding with invalid input."""
     with pytest.raises(ValueError):  # Raised by f_exp
@@ -116,6 +152,15 @@ def test_pressure_decode_invalid():
     assert _pressure_decode("1234567") is None  # Too long
     assert _pressure_decode("") is None  # Empty
     assert _pressure_decode(None) is None  # None
+    assert _pressure_decode(" 12317") is None  # Whitespace
+    assert _pressure_decode("12341²") is None  # Non-ASCII digit
+
+
+def test_pressure_decode_bytes():
+    """Test pressure decoding straight from response bytes."""
+    assert _pressure_decode(b"123417") == pytest.approx(1.234e-3)
+    assert _pressure_decode(b"12a417") is None
+    assert _pressure_decode(b"12341") is None
 
 
 # Tests for _calibration_encode
@@ -130,6 +175,14 @@ def test_calibration_encode_rounding():
     """Test calibration encoding with rounding."""
     assert _calibration_encode(1.2345) == "123"  # 1.2345 * 100 = 123 (rounded)
     assert _calibration_encode(0.995) == "100"  # 0.995 * 100 = 100 (rounded)
+    assert _calibration_encode(0.125) == "13"  # 12.5 rounds half away from zero
+    assert _calibration_encode(-0.125) == "-13"
+    assert _calibration_encode(-1.234) == "-123"
+
+
+def test_calibration_encode_large():
+    """Test calibration encoding is exact for values beyond the float precision of cal * 100."""
+    assert _calibration_encode(66470134381575.05) == "6647013438157505"
 
 
 def test_calibration_encode_zero():
@@ -138,6 +191,12 @@ def test_calibration_encode_zero():
 
 
 # Tests for _calibration_decode
+def test_calibration_decode_bytes():
+    """Test calibration decoding straight from response bytes."""
+    assert _calibration_decode(b"123") == 1.23
+    assert _calibration_decode(b"12.3") is None
+
+
 def test_calibration_decode_valid():
     """Test calibration decoding with valid strings."""
     assert _calibration_decode("123") == 1.23
@@ -150,12 +209,27 @@ def test_calibration_decode_zero():
     assert _calibration_decode("0") == 0.0
 
 
+def test_calibration_decode_negative():
+    """Test calibration decoding of a negative value."""
+    assert _calibration_decode("-12") == -0.12
+    assert _calibration_decode(b"-12") == -0.12
+
+
+def test_calibration_round_trip():
+    """Test decoding an encoded calibration value gives back the value to 2 decimals."""
+    for cal in (1.23, 0.99, 10.0, 0.0, -0.12, -1.5):
+        assert _calibration_decode(_calibration_encode(cal)) == cal
+
+
 def test_calibration_decode_invalid():
     """Test calibration decoding with invalid inputs."""
     assert _calibration_decode("abc") is None  # Non-numeric
     assert _calibration_decode("") is None  # Empty
     assert _calibration_decode(None) is None  # None
     assert _calibration_decode("12.3") is None  # Float string
+    assert _calibration_decode("+12") is None  # Plus sign
+    assert _calibration_decode("-") is None  # Sign only
+    assert _calibration_decode("--12") is None  # Double sign
 
 
 if __name__ == "__main__":
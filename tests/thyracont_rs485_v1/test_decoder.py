@@ -46,6 +46,17 @@ def test_lookup_pdu_class_registered():
     assert pdu_class == ThyracontRequest  # Always returns lookup[0], ignores data
 
 
+def test_register_caches_pdu_class():
+    """Test registering a PDU class fills the table and the cached class used by decode."""
+    decoder = ThyracontDecodePDU()
+    decoder.register(ThyracontRequest)
+    assert decoder.pdu_table[0] == (ThyracontRequest, ThyracontRequest)
+    assert decoder.lookupPduClass(b"Tdata") == ThyracontRequest
+    pdu = decoder.decode(b"M123456")
+    assert isinstance(pdu, ThyracontRequest)
+    assert pdu.data == "123456"
+
+
 # Tests for decode
 def test_decode_valid_frame():
     """Test decoding a valid Thyracont frame."""
@@ -50,8 +50,8 @@ except ModuleNotFoundError:
 from scietex.hal.serial.utilities.numeric import split_32bit, combine_32bit
 
 
-# Fixture for ModbusSlaveContext
-@pytest.fixture
+# Fixture for ModbusSlaveContext, shared by the module and zeroed before each test
+@pytest.fixture(scope="module")
 def context():
     """Create a ModbusSlaveContext with initialized holding registers."""
     # Initialize with 14 registers (0-13) to cover all REG_* constants
@@ -59,6 +59,13 @@ def context():
     return ModbusDeviceContext(hr=data_block)
 
 
+# pylint: disable=redefined-outer-name
+@pytest.fixture(autouse=True)
+def reset_context(context):
+    """Zero all holding registers before each test."""
+    context.store["h"].values[:] = [0] * 14
+
+
 # Tests for read_two_regs
 # pylint: disable=redefined-outer-name
 def test_read_two_regs(context):
@@ -101,6 +108,13 @@ def test_pressure_from_reg_zero(context):
     assert pressure == 0.0
 
 
+# pylint: disable=redefined-outer-name
+def test_pressure_from_reg_too_many_digits(context):
+    """Test that register contents longer than 6 digits are not decoded."""
+    write_two_regs(context, 1000000, REG_P)
+    assert pressure_from_reg(context, REG_P) is None
+
+
 # Tests for pressure_to_reg
 # pylint: disable=redefined-outer-name
 def test_pressure_to_reg(context):
@@ -118,6 +132,15 @@ def test_pressure_to_reg_large(context):
     assert p_encoded == int("123421")  # Encodes 12.34 mbar
 
 
+# pylint: disable=redefined-outer-name
+def test_pressure_to_reg_zero_and_out_of_range(context):
+    """Test encoding a zero pressure and rejecting an exponent beyond two digits."""
+    pressure_to_reg(context, 0.0, REG_P)
+    assert read_two_regs(context, REG_P) == int("000020")
+    with pytest.raises(ValueError):
+        pressure_to_reg(context, 1e-25, REG_P)
+
+
 # Tests for parse_command
 # pylint: disable=redefined-outer-name
 def test_parse_command_type(context):
@@ -126,110 +149,57 @@ def test_parse_command_type(context):
     assert response == b"MTM09D"
 
 
-# pylint: disable=redefined-outer-name
-def test_parse_command_read_pressure(context):
-    """Test parsing the 'M' command (read pressure)."""
-    write_two_regs(context, int("123403"), REG_P)  # 1.23e-3 mbar
-    response = parse_command(context, "M", "ignored")
-    assert response == b"123403"
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_write_pressure(context):
-    """Test parsing the 'm' command (write pressure)."""
-    parse_command(context, "m", "987620")  # 0.9876 mbar
-    p_encoded = read_two_regs(context, REG_P)
-    assert p_encoded == int("987620")
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_read_setpoint(context):
-    """Test parsing the 'S' command (read setpoint)."""
-    write_two_regs(context, int("123422"), REG_SP1)  # 12.34 mbar
-    response = parse_command(context, "S", "1")
-    assert response == b"123422"
-    response = parse_command(context, "S", "2")
-    assert response == b"000000"  # Default REG_SP2 value
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_select_setpoint(context):
-    """Test parsing the 's' command (select setpoint)."""
-    parse_command(context, "s", "1")
-    assert context.store["h"].values[REG_SP_SEL] == 1
-    parse_command(context, "s", "2")
-    assert context.store["h"].values[REG_SP_SEL] == 2
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_write_setpoint(context):
-    """Test parsing the 's' command (write selected setpoint)."""
-    context.store["h"].values[REG_SP_SEL] = 1
-    parse_command(context, "s", "123422")  # 12.34 mbar
-    assert read_two_regs(context, REG_SP1) == int("123422")
-    assert context.store["h"].values[REG_SP_SEL] == 0  # Cleared after write
-    context.store["h"].values[REG_SP_SEL] = 2
-    parse_command(context, "s", "123422")  # 12.34 mbar
-    assert read_two_regs(context, REG_SP2) == int("123422")
-    assert context.store["h"].values[REG_SP_SEL] == 0  # Cleared after write
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_read_calibration(context):
-    """Test parsing the 'C' command (read calibration)."""
-    context.store["h"].values[REG_CAL1] = 123  # 1.23
-    response = parse_command(context, "C", "1")
-    assert response == b"000123"
-    response = parse_command(context, "C", "2")
-    assert response == b"000000"  # Default REG_CAL2 value
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_select_calibration(context):
-    """Test parsing the 'c' command (select calibration)."""
-    parse_command(context, "c", "1")
-    assert context.store["h"].values[REG_CAL_SEL] == 1
-    parse_command(context, "c", "2")
-    assert context.store["h"].values[REG_CAL_SEL] == 2
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_write_calibration(context):
-    """Test parsing the 'c' command (write selected calibration)."""
-    context.store["h"].values[REG_CAL_SEL] = 2
-    parse_command(context, "c", "99")  # 0.99
-    assert context.store["h"].values[REG_CAL2] == 99
-    assert context.store["h"].values[REG_CAL_SEL] == 0  # Cleared after write
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_read_penning_state(context):
-    """Test parsing the 'I' command (read Penning state)."""
-    context.store["h"].values[REG_PENNING_STATE] = 1
-    response = parse_command(context, "I", "ignored")
-    assert response == b"000001"
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_write_penning_state(context):
-    """Test parsing the 'i' command (write Penning state)."""
-    parse_command(context, "i", "2")
-    assert context.store["h"].values[REG_PENNING_STATE] == 2
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_read_penning_sync(context):
-    """Test parsing the 'W' command (read Penning sync)."""
-    context.store["h"].values[REG_PENNING_SYNC] = 42
-    response = parse_command(context, "W", "ignored")
-    assert response == b"000042"
-
-
-# pylint: disable=redefined-outer-name
-def test_parse_command_write_penning_sync(context):
-    """Test parsing the 'w' command (write Penning sync)."""
-    parse_command(context, "w", "15")
-    assert context.store["h"].values[REG_PENNING_SYNC] == 15
+# command, data, register preset, 32-bit register, expected response
+READ_CASES = [
+    ("M", "ignored", (REG_P, int("123403")), True, b"123403"),  # 1.23e-3 mbar
+    ("S", "1", (REG_SP1, int("123422")), True, b"123422"),  # 12.34 mbar
+    ("S", "2", (REG_SP1, int("123422")), True, b"000000"),  # Default REG_SP2 value
+    ("C", "1", (REG_CAL1, 123), False, b"000123"),  # 1.23
+    ("C", "2", (REG_CAL1, 123), False, b"000000"),  # Default REG_CAL2 value
+    ("I", "ignored", (REG_PENNING_STATE, 1), False, b"000001"),
+    ("W", "ignored", (REG_PENNING_SYNC, 42), False, b"000042"),
+]
+
+
+# pylint: disable=redefined-outer-name,too-many-arguments,too-many-positional-arguments
+@pytest.mark.parametrize("command,data,preset,wide,expected", READ_CASES)
+def test_parse_command_read(context, command, data, preset, wide, expected):
+    """Test parsing the read commands (M, S, C, I, W)."""
+    reg, value = preset
+    if wide:
+        write_two_regs(context, value, reg)
+    else:
+        context.store["h"].values[reg] = value
+    assert parse_command(context, command, data) == expected
+
+
+# command, data, selection registers preset, (register, expected value, 32-bit)
+WRITE_CASES = [
+    ("m", "987620", {}, (REG_P, int("987620"), True)),  # 0.9876 mbar
+    ("s", "1", {}, (REG_SP_SEL, 1, False)),
+    ("s", "2", {}, (REG_SP_SEL, 2, False)),
+    ("s", "123422", {REG_SP_SEL: 1}, (REG_SP1, int("123422"), True)),  # 12.34 mbar
+    ("s", "123422", {REG_SP_SEL: 2}, (REG_SP2, int("123422"), True)),  # 12.34 mbar
+    ("c", "1", {}, (REG_CAL_SEL, 1, False)),
+    ("c", "2", {}, (REG_CAL_SEL, 2, False)),
+    ("c", "99", {REG_CAL_SEL: 2}, (REG_CAL2, 99, False)),  # 0.99
+    ("i", "2", {}, (REG_PENNING_STATE, 2, False)),
+    ("w", "15", {}, (REG_PENNING_SYNC, 15, False)),
+]
+
+
+# pylint: disable=redefined-outer-name
+@pytest.mark.parametrize("command,data,preset,expected", WRITE_CASES)
+def test_parse_command_write(context, command, data, preset, expected):
+    """Test parsing the write and select commands (m, s, c, i, w)."""
+    values = context.store["h"].values
+    for sel_reg, selected in preset.items():
+        values[sel_reg] = selected
+    assert parse_command(context, command, data) == data.encode()
+    reg, value, wide = expected
+    assert (read_two_regs(context, reg) if wide else values[reg]) == value
+    for sel_reg in preset:
+        assert values[sel_reg] == 0  # Cleared after write
 
 
 # pylint: disable=redefined-outer-name
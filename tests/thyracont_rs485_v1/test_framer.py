@@ -21,7 +21,8 @@ except ModuleNotFoundError:
     from scietex.hal.vacuum_gauge.thyracont.rs485.v1.framer import ThyracontASCIIFramer
 
 
-@pytest.fixture
+# The decoder and framer keep no per-frame state, so one instance serves the whole module.
+@pytest.fixture(scope="module")
 def decoder():
     """Create an ThyracontDecodePDU instance."""
     dec = ThyracontDecodePDU(is_server=False)
@@ -31,7 +32,7 @@ def decoder():
 
 # Fixture for framer instance
 # pylint: disable=redefined-outer-name
-@pytest.fixture
+@pytest.fixture(scope="module")
 def framer(decoder):
     """Create an ThyracontASCIIFramer instance."""
     return ThyracontASCIIFramer(decoder=decoder)
@@ -46,6 +47,17 @@ def testcalc_checksum():
     assert 64 <= checksum <= 127  # Within printable ASCII range
 
 
+def testcalc_checksum_bytes_like():
+    """Test checksum calculation accepts any bytes-like buffer."""
+    msg = b"001M123456" * 8
+    checksum = calc_checksum(msg)
+    assert checksum == sum(msg) % 64 + 64
+    assert calc_checksum(bytearray(msg)) == checksum
+    assert calc_checksum(memoryview(msg)) == checksum
+    assert calc_checksum(memoryview(msg)[3:-1]) == calc_checksum(msg[3:-1])
+    assert calc_checksum(b"") == 64
+
+
 def testcheck_checksum_valid():
     """Test checksum verification with a valid checksum."""
     msg = b"001T"
@@ -119,6 +131,19 @@ def test_decode_invalid_checksum(decoder):
     assert frame_data == b""
 
 
+# pylint: disable=redefined-outer-name
+def test_decode_invalid_device_id(decoder):
+    """Test decoding a frame with a non-digit device ID."""
+    framer = ThyracontASCIIFramer(decoder)
+    msg = b"0A1T"
+    data = msg + bytes([calc_checksum(msg)]) + b"\r"
+    used_len, dev_id, tid, frame_data = framer.decode(data)
+    assert used_len == 6
+    assert dev_id == 0
+    assert tid == 0
+    assert frame_data == b""
+
+
 # pylint: disable=redefined-outer-name
 def test_decode_multiple_frames(decoder):
     """Test decoding multiple frames in one data chunk."""
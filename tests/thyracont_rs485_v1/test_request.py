@@ -42,6 +42,7 @@ def test_request_init_with_command_and_data():
     assert request.command == "M"  # Only first character
     assert request.function_code == ord("M")
     assert request.data == "123456"
+    assert request.registers == [49, 50, 51, 52, 53, 54]
     assert request.rtu_frame_size == 6
     assert request.dev_id == 2
     assert request.transaction_id == 3
@@ -54,6 +55,14 @@ def test_request_init_long_data():
     assert request.rtu_frame_size == 6
 
 
+def test_request_init_str_data():
+    """Test initialization with data given as a string."""
+    request = ThyracontRequest(command="m", data="1234567")
+    assert request.data == "123456"
+    assert request.registers == [49, 50, 51, 52, 53, 54]
+    assert request.rtu_frame_size == 6
+
+
 # Tests for encode
 def test_request_encode():
     """Test encoding the request data."""
@@ -76,10 +85,20 @@ def test_request_decode():
     request = ThyracontRequest(command="s")
     request.decode(b"987620")
     assert request.data == "987620"
+    assert request.registers == [57, 56, 55, 54, 50, 48]  # ASCII bytes for "987620"
     assert request.rtu_frame_size == 6
     assert request.command == "s"  # Command unchanged
 
 
+def test_request_decode_truncates():
+    """Test decoding keeps only the first 6 bytes of data."""
+    request = ThyracontRequest(command="s")
+    request.decode(b"123456789")
+    assert request.data == "123456"
+    assert request.registers == [49, 50, 51, 52, 53, 54]
+    assert request.rtu_frame_size == 6
+
+
 def test_request_decode_empty():
     """Test decoding empty data."""
     request = ThyracontRequest(command="T")
@@ -90,7 +109,6 @@ def test_request_decode_empty():
 
 # Tests for update_datastore
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
 async def test_update_datastore_read_pressure(context):
     """Test executing a pressure read request ('M')."""
     # Set pressure to 1.234e-3 mbar (encoded as "123417")
@@ -108,7 +126,6 @@ async def test_update_datastore_read_pressure(context):
 
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
 async def test_update_datastore_write_pressure(context):
     """Test executing a pressure write request ('m')."""
     request = ThyracontRequest(command="m", data=b"987620", dev_id=3, transaction_id=2)
@@ -127,7 +144,6 @@ async def test_update_datastore_write_pressure(context):
 
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
 async def test_update_datastore_gauge_type(context):
     """Test executing a gauge type request ('T')."""
     request = ThyracontRequest(command="T", dev_id=1, transaction_id=4)
@@ -142,7 +158,6 @@ async def test_update_datastore_gauge_type(context):
 
 
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
 async def test_update_datastore_empty_command(context):
     """Test executing a request with no command."""
     request = ThyracontRequest(data=b"123456", dev_id=5, transaction_id=6)
@@ -166,7 +181,6 @@ def test_request_decode_invalid_utf8():
 
 # Edge case: update_datastore with invalid context interaction
 # pylint: disable=redefined-outer-name
-@pytest.mark.asyncio
 async def test_update_datastore_invalid_data(context):
     """Test executing a request with invalid data for a command."""
     request = ThyracontRequest(command="m", data=b"abc123")  # Invalid integer for pressure
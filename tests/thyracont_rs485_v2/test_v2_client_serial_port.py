@@ -0,0 +1,88 @@
+"""
+Serial port handling tests for the scietex.hal.vacuum_gauge.Thyracont.rs485.v2.client module.
+
+The 'pyserial' backend talks to a fake serial port here, which lets the tests check that
+the RS485 settings are applied to the port and that the reply is read up to CR.
+"""
+
+from typing import Optional
+
+import pytest
+from serial.rs485 import RS485Settings
+
+# pylint: disable=ungrouped-imports
+from scietex.hal.serial.config import SerialConnectionConfig
+
+try:
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v2 import client as v2_client
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.checksum import calc_checksum
+except ModuleNotFoundError:
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v2 import client as v2_client
+    from scietex.hal.vacuum_gauge.thyracont.rs485.checksum import calc_checksum
+
+REPLY_MSG = b"0012TD06MTM09D"
+
+
+class V2FakePort:
+    """Serial port with a reply and the start of another frame waiting to be read."""
+
+    instances: list["V2FakePort"] = []
+
+    def __init__(self, **kwargs) -> None:
+        self.port = kwargs["port"]
+        self.rs485_mode: Optional[RS485Settings] = None
+        self.pending = REPLY_MSG + bytes([calc_checksum(REPLY_MSG)]) + b"\r0012"
+        self.read_calls: list[bytes] = []
+        V2FakePort.instances.append(self)
+
+    def write(self, frame: bytes) -> int:
+        """Accept the request frame."""
+        return len(frame)
+
+    def read_until(self, expected: bytes) -> bytes:
+        """Read the pending bytes up to and including the terminator."""
+        self.read_calls.append(expected)
+        end = self.pending.index(expected) + len(expected)
+        line, self.pending = self.pending[:end], self.pending[end:]
+        return line
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def v2_port(monkeypatch):
+    """Use V2FakePort for the ports opened by the client module."""
+    V2FakePort.instances = []
+    monkeypatch.setattr(v2_client.serial, "Serial", V2FakePort)
+    return V2FakePort
+
+
+def v2_gauge(rs485_mode: Optional[RS485Settings] = None):
+    """Create a V2 pyserial backend client."""
+    return v2_client.ThyracontVacuumGauge(
+        connection_config=SerialConnectionConfig(port="/dev/null", baudrate=115200),
+        backend="pyserial",
+        rs485_mode=rs485_mode,
+    )
+
+
+# pylint: disable=redefined-outer-name
+async def test_v2_rs485_mode(v2_port):
+    """Test RS485 settings reach the opened port only when they are given."""
+    settings = RS485Settings(delay_before_tx=0.001)
+    assert await v2_gauge(settings).get_model() == "MTM09D"
+    assert await v2_gauge().get_model() == "MTM09D"
+    first, second = v2_port.instances
+    assert first.rs485_mode is settings
+    assert second.rs485_mode is None
+
+
+# pylint: disable=redefined-outer-name
+async def test_v2_read_until_cr(v2_port):
+    """Test the reply is read up to CR, leaving the next frame in the port."""
+    assert await v2_gauge().get_model() == "MTM09D"
+    port = v2_port.instances[0]
+    assert port.read_calls == [b"\r"]
+    assert port.pending == b"0012"
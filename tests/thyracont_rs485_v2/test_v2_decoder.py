@@ -0,0 +1,49 @@
+"""
+Tests for the scietex.hal.vacuum_gauge.Thyracont.rs485.v2.decoder module.
+
+This module tests the ThyracontDecodePDU class of the RS485 V2 protocol, ensuring that valid frames
+are decoded into requests and malformed frames are rejected.
+"""
+
+import pytest
+
+try:
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v2.decoder import ThyracontDecodePDU
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v2.request import ThyracontRequest
+except ModuleNotFoundError:
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v2.decoder import ThyracontDecodePDU
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v2.request import ThyracontRequest
+
+
+@pytest.fixture(scope="module")
+def decoder():
+    """Create a ThyracontDecodePDU instance with ThyracontRequest registered."""
+    v2_decoder = ThyracontDecodePDU(is_server=False)
+    v2_decoder.register(ThyracontRequest)
+    return v2_decoder
+
+
+# pylint: disable=redefined-outer-name
+def test_decode_valid_frame(decoder):
+    """Test decoding a valid reply frame."""
+    pdu = decoder.decode(b"1MV03123")
+    assert isinstance(pdu, ThyracontRequest)
+    assert pdu.function_code == 0
+    assert pdu.command == "MV"
+    assert pdu.data == "123"
+
+
+# pylint: disable=redefined-outer-name
+def test_decode_non_ascii_data(decoder):
+    """Test a frame with non-ASCII data is not decoded."""
+    assert decoder.decode(b"1MV03\xff\xfe\xfd") is None
+
+
+# pylint: disable=redefined-outer-name
+def test_decode_short_frame(decoder):
+    """Test a frame shorter than the header is not decoded."""
+    assert decoder.decode(b"1MV") is None
+
+
+if __name__ == "__main__":
+    pytest.main()
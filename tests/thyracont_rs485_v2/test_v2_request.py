@@ -0,0 +1,75 @@
+"""
+Tests for the scietex.hal.vacuum_gauge.Thyracont.rs485.v2.request module.
+
+This module tests the ThyracontRequest class of the RS485 V2 protocol, ensuring correct encoding,
+decoding and response generation.
+"""
+
+import pytest
+
+try:
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v2.data import AccessCode
+    from src.scietex.hal.vacuum_gauge.thyracont.rs485.v2.request import ThyracontRequest
+except ModuleNotFoundError:
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v2.data import AccessCode
+    from scietex.hal.vacuum_gauge.thyracont.rs485.v2.request import ThyracontRequest
+
+
+# Tests for encode and decode
+def test_request_encode_decode_round_trip():
+    """Test a decoded reply re-encodes to the request it answers."""
+    request = ThyracontRequest(AccessCode.WRITE, "SP", b"123")
+    encoded = request.encode()
+    assert encoded == b"2SP03123"
+    reply = ThyracontRequest()
+    reply.decode(b"3" + encoded[1:])  # the gauge answers with the next access code digit.
+    assert reply.function_code == AccessCode.WRITE.value
+    assert reply.command == "SP"
+    assert reply.data == "123"
+    assert reply.rtu_frame_size == 3
+    assert reply.encode() == encoded
+
+
+def test_request_decode_non_ascii_data():
+    """Test non-ASCII data is rejected when the frame is decoded."""
+    request = ThyracontRequest()
+    with pytest.raises(ValueError):
+        request.decode(b"1MV03\xff\xfe\xfd")
+
+
+def test_request_data_non_ascii():
+    """Test non-ASCII data is rejected by the data setter."""
+    request = ThyracontRequest(command="MV")
+    with pytest.raises(ValueError):
+        request.data = "µbar"
+    with pytest.raises(ValueError):
+        request.data = b"\xb5"
+    assert request.data == ""
+
+
+# Tests for update_datastore
+async def test_update_datastore_response():
+    """Test the response echoes the request with the next access code."""
+    request = ThyracontRequest(command="MV", data=b"12", dev_id=2, transaction_id=3)
+    request.function_code = 1
+    response = await request.update_datastore(None)
+    assert isinstance(response, ThyracontRequest)
+    assert response.function_code == 2
+    assert response.command == "MV"
+    assert response.data == "12"
+    assert response.registers == [49, 50]
+    assert response.rtu_frame_size == 2
+    assert response.dev_id == 2
+    assert response.transaction_id == 3
+
+
+async def test_update_datastore_invalid_access_code():
+    """Test a response access code that is not supported is rejected."""
+    request = ThyracontRequest(command="MV")
+    request.function_code = 4  # 5 is not an access code.
+    with pytest.raises(ValueError):
+        await request.update_datastore(None)
+
+
+if __name__ == "__main__":
+    pytest.main()